@@ -0,0 +1,41 @@
+"""Add items user_id index
+
+Revision ID: 9bd1b0741bab
+Revises: b389592974f8
+Create Date: 2026-10-17 09:12:31.402118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9bd1b0741bab"
+down_revision: Union[str, None] = "b389592974f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; building the index this
+    # way avoids locking the items table against writes while it is created
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_user_id_id",
+            "items",
+            ["user_id", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_items_user_id_id",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
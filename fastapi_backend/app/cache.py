@@ -0,0 +1,279 @@
+"""Caches for authenticated users and their item listings.
+
+Authenticated requests resolve the token's user id to a ``User`` row on every
+call. Caching the row's columns in a small in-process LRU backed by Redis lets
+most requests skip that query. Entries are short-lived and are invalidated by
+``UserManager`` hooks whenever a user changes.
+
+Item listing pages are cached in Redis under a per-user collection version
+that every item write bumps, so a write never has to find and delete the
+pages it made stale.
+"""
+
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, Hashable, TypeVar
+
+from redis.exceptions import RedisError
+
+from .config import settings
+from .models import User
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded in-process mapping whose entries expire after a TTL."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class CacheStats:
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+
+
+USER_COLUMNS = [column.key for column in User.__table__.columns]
+
+
+def serialize_user(user: User) -> dict[str, Any]:
+    return {key: getattr(user, key) for key in USER_COLUMNS}
+
+
+class UserCache:
+    """User column cache: in-process LRU in front of Redis."""
+
+    key_prefix = "user-cache:"
+
+    def __init__(self):
+        self.enabled = settings.USER_CACHE_ENABLED
+        self.redis_ttl_seconds = settings.USER_CACHE_TTL_SECONDS
+        self.local = LRUCache[uuid.UUID, dict[str, Any]](
+            settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_LOCAL_TTL_SECONDS
+        )
+        self.stats = CacheStats()
+
+    def _key(self, user_id: uuid.UUID) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    async def get(self, user_id: uuid.UUID) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+
+        fields = self.local.get(user_id)
+        if fields is not None:
+            self.stats.local_hits += 1
+            return dict(fields)
+
+        try:
+            payload = await get_redis().get(self._key(user_id))
+        except (RedisError, OSError) as e:
+            self.stats.errors += 1
+            logger.warning("User cache read failed: %s", e)
+            payload = None
+
+        if payload is None:
+            self.stats.misses += 1
+            return None
+
+        fields = json.loads(payload)
+        fields["id"] = uuid.UUID(fields["id"])
+        self.stats.redis_hits += 1
+        self.local.set(user_id, fields)
+        return dict(fields)
+
+    async def set(self, user: User) -> None:
+        if not self.enabled:
+            return
+
+        fields = serialize_user(user)
+        self.local.set(user.id, fields)
+        try:
+            await get_redis().set(
+                self._key(user.id),
+                json.dumps(fields, default=str),
+                ex=self.redis_ttl_seconds,
+            )
+        except (RedisError, OSError) as e:
+            self.stats.errors += 1
+            logger.warning("User cache write failed: %s", e)
+
+    async def invalidate(self, user_id: uuid.UUID) -> None:
+        self.local.delete(user_id)
+        if not self.enabled:
+            return
+        try:
+            await get_redis().delete(self._key(user_id))
+        except (RedisError, OSError) as e:
+            self.stats.errors += 1
+            logger.warning("User cache invalidation failed: %s", e)
+
+    def clear(self) -> None:
+        self.local.clear()
+        self.stats = CacheStats()
+
+
+user_cache = UserCache()
+
+
+@dataclass
+class ItemListCacheStats:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses + self.not_modified
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+            # 304s are answered from the version alone, so they count as hits
+            "hit_rate": round((self.hits + self.not_modified) / lookups, 4)
+            if lookups
+            else 0.0,
+        }
+
+
+class ItemListCache:
+    """Serialized item pages keyed by the owner's collection version.
+
+    Writers bump the version *after* committing. A reader that loaded its
+    page before the commit can only store it under the old version, which no
+    later request looks up, so stale pages are never served once the bump
+    has landed.
+    """
+
+    key_prefix = "item-list:"
+
+    def __init__(self):
+        self.enabled = settings.ITEM_CACHE_ENABLED
+        self.ttl_seconds = settings.ITEM_CACHE_TTL_SECONDS
+        self.stats = ItemListCacheStats()
+
+    def _version_key(self, user_id: uuid.UUID) -> str:
+        return f"{self.key_prefix}version:{user_id}"
+
+    def _page_key(self, user_id: uuid.UUID, version: int, page: int, size: int):
+        return f"{self.key_prefix}{user_id}:{version}:{page}:{size}"
+
+    @staticmethod
+    def etag(version: int, page: int, size: int) -> str:
+        return f'"items-{version}-{page}-{size}"'
+
+    async def get_version(self, user_id: uuid.UUID) -> int | None:
+        """Return the collection version, or None if caching is unavailable."""
+        if not self.enabled:
+            return None
+        key = self._version_key(user_id)
+        try:
+            redis = get_redis()
+            version = await redis.get(key)
+            if version is None:
+                # Seed from the clock so a lost version key can never make an
+                # old page key current again
+                await redis.set(key, time.time_ns(), nx=True)
+                version = await redis.get(key)
+        except (RedisError, OSError) as e:
+            self.stats.errors += 1
+            logger.warning("Item list cache version read failed: %s", e)
+            return None
+        return int(version)
+
+    async def bump(self, user_id: uuid.UUID) -> None:
+        """Invalidate every cached page of ``user_id``; call after committing."""
+        if not self.enabled:
+            return
+        key = self._version_key(user_id)
+        try:
+            redis = get_redis()
+            if not await redis.set(key, time.time_ns(), nx=True):
+                await redis.incr(key)
+        except (RedisError, OSError) as e:
+            self.stats.errors += 1
+            logger.warning("Item list cache invalidation failed: %s", e)
+
+    async def get_page(
+        self, user_id: uuid.UUID, version: int, page: int, size: int
+    ) -> str | None:
+        try:
+            body = await get_redis().get(self._page_key(user_id, version, page, size))
+        except (RedisError, OSError) as e:
+            self.stats.errors += 1
+            logger.warning("Item list cache read failed: %s", e)
+            body = None
+        if body is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return body
+
+    async def set_page(
+        self, user_id: uuid.UUID, version: int, page: int, size: int, body: str
+    ) -> None:
+        try:
+            await get_redis().set(
+                self._page_key(user_id, version, page, size),
+                body,
+                ex=self.ttl_seconds,
+            )
+        except (RedisError, OSError) as e:
+            self.stats.errors += 1
+            logger.warning("Item list cache write failed: %s", e)
+
+    def clear(self) -> None:
+        self.stats = ItemListCacheStats()
+
+
+item_list_cache = ItemListCache()
@@ -1,4 +1,4 @@
-from typing import Set
+from typing import Literal, Set
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,8 +11,19 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     TEST_DATABASE_URL: str | None = None
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_SOCKET_TIMEOUT: float = 0.5
     EXPIRE_ON_COMMIT: bool = False
 
+    # Deployment: "serverless" (Vercel) opens a fresh connection per request,
+    # "container" keeps a connection pool alive for long-running processes
+    DEPLOYMENT_MODE: Literal["serverless", "container"] = "serverless"
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+
     # User
     ACCESS_SECRET_KEY: str
     RESET_PASSWORD_SECRET_KEY: str
@@ -20,6 +31,16 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_SECONDS: int = 3600
 
+    # User cache (in-process LRU in front of Redis)
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_LOCAL_TTL_SECONDS: float = 5.0
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # Item list cache (Redis, keyed by a per-user collection version)
+    ITEM_CACHE_ENABLED: bool = True
+    ITEM_CACHE_TTL_SECONDS: int = 300
+
     # Email
     MAIL_USERNAME: str | None = None
     MAIL_PASSWORD: str | None = None
@@ -33,6 +54,27 @@ class Settings(BaseSettings):
     VALIDATE_CERTS: bool = True
     TEMPLATE_DIR: str = "email_templates"
 
+    # Email delivery: "outbox" queues messages in Redis for the background
+    # worker, "inline" sends them during the request
+    EMAIL_DELIVERY: Literal["inline", "outbox"] = "outbox"
+    EMAIL_WORKER_IN_PROCESS: bool = True
+    EMAIL_BATCH_SIZE: int = 50
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BACKOFF_SECONDS: float = 2.0
+    EMAIL_POLL_INTERVAL_SECONDS: float = 0.5
+    EMAIL_SMTP_IDLE_TIMEOUT_SECONDS: float = 30.0
+
+    # Serialization: list endpoints fetch plain rows and validate each page
+    # once instead of hydrating ORM objects and validating twice
+    FAST_SERIALIZATION: bool = False
+
+    # Metrics: per-route latency and SQL histograms served at /metrics
+    METRICS_ENABLED: bool = True
+
+    # Health checks
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_CACHE_TTL_SECONDS: float = 1.0
+
     # Frontend
     FRONTEND_URL: str = "http://localhost:3000"
 
@@ -1,12 +1,22 @@
-from typing import AsyncGenerator
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator
 from urllib.parse import urlparse
 
 from fastapi import Depends
 from fastapi_users.db import SQLAlchemyUserDatabase
 from sqlalchemy import NullPool
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from .config import settings
+from .metrics import install_query_hooks, record_connection_wait
 from .models import Base, User
 
 
@@ -18,8 +28,99 @@ async_db_connection_url = (
     f"{parsed_db_url.path}"
 )
 
-# Disable connection pooling for serverless environments like Vercel
-engine = create_async_engine(async_db_connection_url, poolclass=NullPool)
+
+@dataclass
+class PoolMetrics:
+    """Cumulative connection checkout counters for the pooled engine."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record_checkout(self, elapsed: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += elapsed
+        self.wait_seconds_max = max(self.wait_seconds_max, elapsed)
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each connection checkout takes."""
+
+    def connect(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        elapsed = time.perf_counter() - start
+        pool_metrics.record_checkout(elapsed)
+        record_connection_wait(elapsed)
+        return connection
+
+
+def get_engine_options(deployment_mode: str) -> dict[str, Any]:
+    if deployment_mode == "serverless":
+        # Disable connection pooling for serverless environments like Vercel
+        return {"poolclass": NullPool}
+
+    # Long-running processes keep connections open between requests
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "connect_args": {
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE
+        },
+    }
+
+
+def build_engine(
+    deployment_mode: str, url: str = async_db_connection_url
+) -> AsyncEngine:
+    engine = create_async_engine(url, **get_engine_options(deployment_mode))
+    if settings.METRICS_ENABLED:
+        install_query_hooks(engine)
+    return engine
+
+
+def get_pool_status() -> dict[str, Any]:
+    status: dict[str, Any] = {"deployment_mode": settings.DEPLOYMENT_MODE}
+    pool = engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+    status.update(
+        {
+            "checkouts": pool_metrics.checkouts,
+            "timeouts": pool_metrics.timeouts,
+            "wait_seconds_total": round(pool_metrics.wait_seconds_total, 6),
+            "wait_seconds_max": round(pool_metrics.wait_seconds_max, 6),
+        }
+    )
+    return status
+
+
+engine = build_engine(settings.DEPLOYMENT_MODE)
 
 async_session_maker = async_sessionmaker(
     engine, expire_on_commit=settings.EXPIRE_ON_COMMIT
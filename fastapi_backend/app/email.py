@@ -1,9 +1,16 @@
+import logging
 from pathlib import Path
 import urllib.parse
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
+from redis.exceptions import RedisError
+
 from .config import settings
+from .email_outbox import enqueue_email
 from .models import User
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
 
 
 def get_email_config():
@@ -23,19 +30,50 @@ def get_email_config():
     return conf
 
 
-async def send_reset_password_email(user: User, token: str):
+async def send_email_now(
+    recipients: list[str], subject: str, template_name: str, context: dict
+):
+    """Send an email inline, bypassing the outbox."""
     conf = get_email_config()
+    message = MessageSchema(
+        subject=subject,
+        recipients=recipients,
+        template_body=context,
+        subtype=MessageType.html,
+    )
+
+    fm = FastMail(conf)
+    await fm.send_message(message, template_name=template_name)
+
+
+async def send_email(
+    recipients: list[str], subject: str, template_name: str, context: dict
+):
+    """Queue an email for the outbox worker, or send it inline if configured.
+
+    Falls back to sending inline when Redis is unavailable so the message is
+    not lost.
+    """
+    if settings.EMAIL_DELIVERY == "inline":
+        await send_email_now(recipients, subject, template_name, context)
+        return
+
+    try:
+        await enqueue_email(get_redis(), recipients, subject, template_name, context)
+    except (RedisError, OSError) as e:
+        logger.warning("Email outbox unavailable, sending inline: %s", e)
+        await send_email_now(recipients, subject, template_name, context)
+
+
+async def send_reset_password_email(user: User, token: str):
     email = user.email
     base_url = f"{settings.FRONTEND_URL}/password-recovery/confirm?"
     params = {"token": token}
     encoded_params = urllib.parse.urlencode(params)
     link = f"{base_url}{encoded_params}"
-    message = MessageSchema(
-        subject="Password recovery",
-        recipients=[email],
-        template_body={"username": email, "link": link},
-        subtype=MessageType.html,
+    await send_email(
+        [email],
+        "Password recovery",
+        "password_reset.html",
+        {"username": email, "link": link},
     )
-
-    fm = FastMail(conf)
-    await fm.send_message(message, template_name="password_reset.html")
@@ -0,0 +1,193 @@
+"""Email outbox: a Redis-backed queue drained by a long-lived SMTP worker.
+
+Request handlers only push a small JSON payload onto the outbox list, so their
+latency no longer depends on the mail server. The worker renders templates
+from a compiled-template cache, sends batches over one persistent SMTP
+connection and reschedules failures with exponential backoff.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from email.message import EmailMessage
+from email.utils import formataddr
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from aiosmtplib import SMTP, SMTPException
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from redis.asyncio import Redis
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_KEY = "email:outbox"
+RETRY_KEY = "email:retry"
+DEAD_LETTER_KEY = "email:dead"
+
+
+@lru_cache
+def get_template_environment() -> Environment:
+    """Return the Jinja environment; compiled templates are cached on it."""
+    return Environment(
+        loader=FileSystemLoader(Path(__file__).parent / settings.TEMPLATE_DIR),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=False,
+    )
+
+
+def warm_templates() -> None:
+    """Compile every template up front so the first send pays no parse cost."""
+    environment = get_template_environment()
+    for name in environment.list_templates(extensions=["html"]):
+        environment.get_template(name)
+
+
+def render_template(template_name: str, context: dict[str, Any]) -> str:
+    return get_template_environment().get_template(template_name).render(context)
+
+
+async def enqueue_email(
+    redis: Redis,
+    recipients: list[str],
+    subject: str,
+    template_name: str,
+    context: dict[str, Any],
+) -> str:
+    """Queue an email for the worker and return its id."""
+    message_id = str(uuid.uuid4())
+    payload = {
+        "id": message_id,
+        "recipients": recipients,
+        "subject": subject,
+        "template": template_name,
+        "context": context,
+        "attempts": 0,
+    }
+    await redis.rpush(OUTBOX_KEY, json.dumps(payload))
+    return message_id
+
+
+def build_message(payload: dict[str, Any]) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = payload["subject"]
+    message["From"] = formataddr((settings.MAIL_FROM_NAME, settings.MAIL_FROM or ""))
+    message["To"] = ", ".join(payload["recipients"])
+    message.set_content(
+        render_template(payload["template"], payload["context"]), subtype="html"
+    )
+    return message
+
+
+class EmailWorker:
+    """Drain the outbox over a persistent SMTP connection."""
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.batch_size = settings.EMAIL_BATCH_SIZE
+        self.max_attempts = settings.EMAIL_MAX_ATTEMPTS
+        self.backoff_seconds = settings.EMAIL_RETRY_BACKOFF_SECONDS
+        self.poll_interval = settings.EMAIL_POLL_INTERVAL_SECONDS
+        self.idle_timeout = settings.EMAIL_SMTP_IDLE_TIMEOUT_SECONDS
+        self._smtp: SMTP | None = None
+        self._last_used = 0.0
+
+    def _create_client(self) -> SMTP:
+        use_credentials = settings.USE_CREDENTIALS and settings.MAIL_USERNAME
+        return SMTP(
+            hostname=settings.MAIL_SERVER,
+            port=settings.MAIL_PORT,
+            username=settings.MAIL_USERNAME if use_credentials else None,
+            password=settings.MAIL_PASSWORD if use_credentials else None,
+            use_tls=settings.MAIL_SSL_TLS,
+            start_tls=settings.MAIL_STARTTLS,
+            validate_certs=settings.VALIDATE_CERTS,
+        )
+
+    async def _connection(self) -> SMTP:
+        if self._smtp is not None and self._smtp.is_connected:
+            return self._smtp
+        self._smtp = self._create_client()
+        await self._smtp.connect()
+        return self._smtp
+
+    async def close(self) -> None:
+        if self._smtp is not None and self._smtp.is_connected:
+            try:
+                await self._smtp.quit()
+            except (SMTPException, OSError):
+                self._smtp.close()
+        self._smtp = None
+
+    async def promote_due_retries(self) -> None:
+        """Move retries whose backoff has elapsed back onto the outbox."""
+        due = await self.redis.zrangebyscore(RETRY_KEY, 0, time.time())
+        for raw in due:
+            # Only the worker that removes the entry re-queues it
+            if await self.redis.zrem(RETRY_KEY, raw):
+                await self.redis.rpush(OUTBOX_KEY, raw)
+
+    async def fetch_batch(self) -> list[dict[str, Any]]:
+        raw = await self.redis.lpop(OUTBOX_KEY, self.batch_size)
+        return [json.loads(item) for item in raw or []]
+
+    async def schedule_retry(self, payload: dict[str, Any], error: Exception) -> None:
+        payload["attempts"] += 1
+        payload["last_error"] = str(error)[:200]
+        if payload["attempts"] >= self.max_attempts:
+            logger.error("Giving up on email %s: %s", payload["id"], error)
+            await self.redis.rpush(DEAD_LETTER_KEY, json.dumps(payload))
+            return
+        delay = self.backoff_seconds * 2 ** (payload["attempts"] - 1)
+        await self.redis.zadd(RETRY_KEY, {json.dumps(payload): time.time() + delay})
+
+    async def send_batch(self, batch: list[dict[str, Any]]) -> int:
+        """Send ``batch`` over one connection; return how many were delivered."""
+        sent = 0
+        for payload in batch:
+            try:
+                smtp = await self._connection()
+                await smtp.send_message(build_message(payload))
+                sent += 1
+            except (SMTPException, OSError) as e:
+                logger.warning("Sending email %s failed: %s", payload["id"], e)
+                await self.close()
+                await self.schedule_retry(payload, e)
+            except Exception as e:
+                # A bad payload must not take the rest of the batch down
+                logger.exception("Email %s could not be built", payload["id"])
+                payload["attempts"] = self.max_attempts - 1
+                await self.schedule_retry(payload, e)
+        self._last_used = time.monotonic()
+        return sent
+
+    async def run_once(self) -> int:
+        await self.promote_due_retries()
+        batch = await self.fetch_batch()
+        if not batch:
+            if self._smtp is not None and (
+                time.monotonic() - self._last_used > self.idle_timeout
+            ):
+                await self.close()
+            return 0
+        return await self.send_batch(batch)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        warm_templates()
+        try:
+            while not stop.is_set():
+                try:
+                    if await self.run_once():
+                        continue
+                except Exception:
+                    logger.exception("Email worker iteration failed")
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.close()
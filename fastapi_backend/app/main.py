@@ -1,14 +1,47 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi_pagination import add_pagination
+from .database import engine
+from .email_outbox import EmailWorker
+from .metrics import MetricsMiddleware
+from .redis_client import close_redis, get_redis
+from .responses import DefaultJSONResponse
 from .schemas import UserCreate, UserRead, UserUpdate
 from .users import auth_backend, fastapi_users, AUTH_URL_PATH
 from fastapi.middleware.cors import CORSMiddleware
 from .utils import simple_generate_unique_route_id
 from app.routes.items import router as items_router
 from app.routes.health import router as health_router
+from app.routes.metrics import router as metrics_router
 from app.config import settings
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create the shared Redis pool up front; close pools on shutdown
+    redis = get_redis()
+
+    stop_email_worker = asyncio.Event()
+    email_worker_task = None
+    if settings.EMAIL_DELIVERY == "outbox" and settings.EMAIL_WORKER_IN_PROCESS:
+        email_worker_task = asyncio.create_task(
+            EmailWorker(redis).run(stop_email_worker)
+        )
+
+    yield
+
+    stop_email_worker.set()
+    if email_worker_task is not None:
+        await email_worker_task
+    await close_redis()
+    await engine.dispose()
+
+
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
     generate_unique_id_function=simple_generate_unique_route_id,
     openapi_url=settings.OPENAPI_URL,
 )
@@ -22,6 +55,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost middleware so the recorded latency covers the whole stack
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include authentication and user management routes
 app.include_router(
     fastapi_users.get_auth_router(auth_backend),
@@ -55,4 +92,8 @@ app.include_router(items_router, prefix="/items")
 # Include health check routes
 app.include_router(health_router)
 
+# Include Prometheus metrics route
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+
 add_pagination(app)
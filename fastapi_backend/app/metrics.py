@@ -0,0 +1,209 @@
+"""Request and database instrumentation exposed in Prometheus text format.
+
+``MetricsMiddleware`` times every request and labels it with the route's
+operation id (see ``simple_generate_unique_route_id``). While a request is in
+flight its ``RequestStats`` lives in a context variable, which the SQLAlchemy
+cursor hooks and the pooled engine's checkout timer add to; the totals are
+folded into per-route histograms once the response has been sent.
+"""
+
+import bisect
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RequestStats:
+    """SQL work attributed to the request currently being served."""
+
+    queries: int = 0
+    query_seconds: float = 0.0
+    connection_wait_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def record_connection_wait(elapsed: float) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.connection_wait_seconds += elapsed
+
+
+class Histogram:
+    """Cumulative Prometheus histogram with one series per label set."""
+
+    def __init__(self, name: str, documentation: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self._series: dict[tuple[tuple[str, str], ...], list[Any]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        series = self._series.get(key)
+        if series is None:
+            # Per-bucket counts (plus +Inf), sum
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(tuple(sorted(labels.items())))
+        return sum(series[0]) if series else 0
+
+    def total(self, **labels: str) -> float:
+        series = self._series.get(tuple(sorted(labels.items())))
+        return series[1] if series else 0.0
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for key, (counts, total) in sorted(self._series.items()):
+            labels = ",".join(f'{name}="{value}"' for name, value in key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"{self.name}_sum{{{labels}}} {total}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time spent serving HTTP requests.",
+    LATENCY_BUCKETS,
+)
+request_queries = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request.",
+    QUERY_COUNT_BUCKETS,
+)
+request_query_duration = Histogram(
+    "http_request_db_query_duration_seconds",
+    "Time spent executing SQL per HTTP request.",
+    LATENCY_BUCKETS,
+)
+request_connection_wait = Histogram(
+    "http_request_db_connection_wait_seconds",
+    "Time spent waiting for a pooled connection per HTTP request.",
+    LATENCY_BUCKETS,
+)
+HISTOGRAMS = (
+    request_duration,
+    request_queries,
+    request_query_duration,
+    request_connection_wait,
+)
+
+
+def reset_metrics() -> None:
+    for histogram in HISTOGRAMS:
+        histogram.clear()
+
+
+def render_metrics(extra_lines: list[str] | None = None) -> str:
+    lines = [line for histogram in HISTOGRAMS for line in histogram.render()]
+    return "\n".join([*lines, *(extra_lines or [])]) + "\n"
+
+
+def route_id(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "unique_id", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware; avoids the per-request task of BaseHTTPMiddleware."""
+
+    def __init__(self, app: ASGIApp, exclude_paths: tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_stats.reset(token)
+            # The router stores the matched route on the scope it was given
+            route = route_id(scope)
+            request_duration.observe(
+                elapsed, route=route, method=scope["method"], status=str(status_code)
+            )
+            request_queries.observe(stats.queries, route=route)
+            request_query_duration.observe(stats.query_seconds, route=route)
+            request_connection_wait.observe(stats.connection_wait_seconds, route=route)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += elapsed
+
+
+def _handle_error(exception_context):  # type: ignore[no-untyped-def]
+    # A failed statement never reaches after_cursor_execute
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def install_query_hooks(engine: AsyncEngine) -> None:
+    """Count statements and SQL time for the current request on ``engine``."""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -1,6 +1,6 @@
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from uuid import uuid4
@@ -16,6 +16,10 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
 
 class Item(Base):
     __tablename__ = "items"
+    __table_args__ = (
+        # Serves every owner-scoped lookup: listing, keyset pages and deletes
+        Index("ix_items_user_id_id", "user_id", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String, nullable=False)
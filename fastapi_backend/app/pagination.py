@@ -0,0 +1,96 @@
+"""Keyset (cursor) pagination helpers.
+
+Keyset pagination seeks past the last row of the previous page using an
+indexed, unique sort key instead of skipping rows with ``OFFSET``, so every
+page costs the same regardless of how deep the client has scrolled.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Literal
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+TotalMode = Literal["none", "approximate", "exact"]
+
+
+def encode_cursor(value: UUID) -> str:
+    """Encode the last key of a page as an opaque, URL-safe cursor."""
+    payload = json.dumps({"id": str(value)}).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> UUID:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        return UUID(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+async def estimate_count(db: AsyncSession, query: Select[Any]) -> int:
+    """Return the planner's row estimate for ``query`` without executing it."""
+    connection = await db.connection()
+    compiled = query.compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(
+    db: AsyncSession, query: Select[Any], mode: TotalMode
+) -> int | None:
+    if mode == "none":
+        return None
+    if mode == "approximate":
+        return await estimate_count(db, query)
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await db.execute(count_query)).scalar_one()
+
+
+async def keyset_paginate(
+    db: AsyncSession,
+    query: Select[Any],
+    key: InstrumentedAttribute[Any],
+    cursor: str | None,
+    size: int,
+    total: TotalMode = "none",
+) -> dict[str, Any]:
+    """Return one page of ``query`` ordered by the unique column ``key``.
+
+    One extra row is fetched to tell whether another page exists, so no
+    ``COUNT(*)`` is needed unless the caller explicitly asks for a total.
+    """
+    page_query = query
+    if cursor is not None:
+        page_query = page_query.where(key > decode_cursor(cursor))
+    page_query = page_query.order_by(key).limit(size + 1)
+
+    result = await db.execute(page_query)
+    # select(Model) yields entities; a select of several columns yields rows
+    if len(query.column_descriptions) == 1:
+        rows = list(result.scalars().all())
+    else:
+        rows = list(result.all())
+    has_next = len(rows) > size
+    rows = rows[:size]
+
+    return {
+        "items": rows,
+        "size": size,
+        "next_cursor": encode_cursor(getattr(rows[-1], key.key)) if has_next else None,
+        "total": await count_rows(db, query, total),
+    }
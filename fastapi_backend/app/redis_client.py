@@ -0,0 +1,31 @@
+"""Shared Redis client used across the application."""
+
+from redis.asyncio import Redis
+
+from .config import settings
+
+_client: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Return the process-wide Redis client, creating it on first use.
+
+    The client owns a connection pool, so reusing it avoids a new TCP
+    connection for every cache lookup.
+    """
+    global _client
+    if _client is None:
+        _client = Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,8 @@
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson  # noqa: F401
+except ImportError:  # orjson ships with the optional "speedups" extra
+    DefaultJSONResponse: type[JSONResponse] = JSONResponse
+else:
+    DefaultJSONResponse = ORJSONResponse
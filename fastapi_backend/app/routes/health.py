@@ -1,12 +1,16 @@
 """Health check routes for infrastructure validation."""
 
-from typing import Any
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
 from sqlalchemy import text
 
-from app.database import get_async_session
+from app.cache import item_list_cache, user_cache
+from app.database import async_session_maker, get_pool_status
 from app.config import settings
+from app.redis_client import get_redis
 
 router = APIRouter(tags=["health"])
 
@@ -14,7 +18,7 @@ router = APIRouter(tags=["health"])
 async def check_postgres() -> str:
     """Check PostgreSQL connectivity."""
     try:
-        async for session in get_async_session():
+        async with async_session_maker() as session:
             result = await session.execute(text("SELECT 1"))
             result.fetchone()
             return "ok"
@@ -23,21 +27,75 @@ async def check_postgres() -> str:
 
 
 async def check_redis() -> str:
-    """Check Redis connectivity using connection pool."""
+    """Check Redis connectivity using the shared connection pool."""
     try:
-        from redis.asyncio import Redis
-
-        # Redis client manages its own connection pool internally
-        client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
-        try:
-            await client.ping()
-            return "ok"
-        finally:
-            await client.aclose()
+        await get_redis().ping()
+        return "ok"
     except Exception as e:
         return f"error: {str(e)[:50]}"
 
 
+async def run_probe(probe: Callable[[], Awaitable[str]]) -> str:
+    """Run a single probe, reporting it as failed if it exceeds its timeout."""
+    try:
+        return await asyncio.wait_for(
+            probe(), timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        return "error: timeout"
+
+
+class ProbeCache:
+    """Share one dependency check between all probes arriving within a TTL.
+
+    Orchestrators probe every pod frequently; collapsing bursts into a single
+    check keeps probe traffic to Postgres and Redis constant.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.reset()
+
+    def reset(self) -> None:
+        self._result: dict[str, str] | None = None
+        self._checked_at = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    def _fresh(self) -> dict[str, str] | None:
+        if (
+            self._result is not None
+            and time.monotonic() - self._checked_at < self.ttl_seconds
+        ):
+            return self._result
+        return None
+
+    async def get(self) -> dict[str, str]:
+        result = self._fresh()
+        if result is not None:
+            return result
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # Another probe may have refreshed the result while we waited
+            result = self._fresh()
+            if result is None:
+                postgres_status, redis_status = await asyncio.gather(
+                    run_probe(check_postgres), run_probe(check_redis)
+                )
+                result = {"postgres": postgres_status, "redis": redis_status}
+                self._result = result
+                self._checked_at = time.monotonic()
+        return result
+
+
+probe_cache = ProbeCache(settings.HEALTH_CACHE_TTL_SECONDS)
+
+
+def dependencies_ok(statuses: dict[str, str]) -> bool:
+    return all(value == "ok" for value in statuses.values())
+
+
 @router.get("/health")
 async def health_check() -> dict[str, Any]:
     """
@@ -46,18 +104,11 @@ async def health_check() -> dict[str, Any]:
     Returns status of PostgreSQL and Redis connectivity.
     Returns 200 if all services are healthy.
     """
-    postgres_status = await check_postgres()
-    redis_status = await check_redis()
+    statuses = await probe_cache.get()
 
-    overall_status = "healthy"
-    if postgres_status != "ok" or redis_status != "ok":
-        overall_status = "unhealthy"
+    overall_status = "healthy" if dependencies_ok(statuses) else "unhealthy"
 
-    return {
-        "status": overall_status,
-        "postgres": postgres_status,
-        "redis": redis_status,
-    }
+    return {"status": overall_status, **statuses}
 
 
 @router.get("/health/live")
@@ -66,21 +117,34 @@ async def liveness() -> dict[str, str]:
     return {"status": "alive"}
 
 
-@router.get("/health/ready")
-async def readiness() -> dict[str, Any]:
-    """Readiness probe - only returns 200 if dependencies are ready."""
-    postgres_status = await check_postgres()
-    redis_status = await check_redis()
+@router.get("/health/pool")
+async def pool_status() -> dict[str, Any]:
+    """Database connection pool occupancy and checkout wait metrics."""
+    return get_pool_status()
 
-    if postgres_status != "ok" or redis_status != "ok":
-        return {
-            "status": "not_ready",
-            "postgres": postgres_status,
-            "redis": redis_status,
-        }
 
+@router.get("/health/cache")
+async def cache_status() -> dict[str, Any]:
+    """Hit and miss counters for the user and item list caches."""
     return {
-        "status": "ready",
-        "postgres": postgres_status,
-        "redis": redis_status,
+        "user_cache": {
+            **user_cache.stats.as_dict(),
+            "local_size": len(user_cache.local),
+        },
+        "item_list_cache": item_list_cache.stats.as_dict(),
     }
+
+
+@router.get(
+    "/health/ready",
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Not ready"}},
+)
+async def readiness(response: Response) -> dict[str, Any]:
+    """Readiness probe - only returns 200 if dependencies are ready."""
+    statuses = await probe_cache.get()
+
+    if not dependencies_ok(statuses):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "not_ready", **statuses}
+
+    return {"status": "ready", **statuses}
@@ -1,33 +1,202 @@
-from uuid import UUID
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Literal
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import apaginate
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import any_, bindparam, delete, insert
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.cache import item_list_cache
+from app.config import settings
 from app.database import User, get_async_session
 from app.models import Item
-from app.schemas import ItemRead, ItemCreate
+from app.pagination import TotalMode, keyset_paginate
+from app.schemas import (
+    BULK_MAX_ITEMS,
+    ItemBulkCreateResponse,
+    ItemBulkCreateResult,
+    ItemBulkDelete,
+    ItemBulkDeleteResponse,
+    ItemBulkDeleteResult,
+    ItemCursorPage,
+    ItemRead,
+    ItemCreate,
+)
 from app.users import current_active_user
 
 router = APIRouter(tags=["item"])
 
+# Every handler that writes items must call item_list_cache.bump(user.id)
+# after committing, or GET /items/ keeps serving the previous pages
+
+ITEM_COLUMNS = (Item.id, Item.name, Item.description, Item.quantity, Item.user_id)
+EXPORT_FIELDS = [column.key for column in ITEM_COLUMNS]
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+# Built once at import; validating a whole page through it is a single call
+# into pydantic-core instead of one model_validate per row
+item_list_adapter = TypeAdapter(list[ItemRead])
+
 
 def transform_items(items):
     return [ItemRead.model_validate(item) for item in items]
 
 
-@router.get("/", response_model=Page[ItemRead])
+def transform_rows(rows):
+    return item_list_adapter.validate_python(rows, from_attributes=True)
+
+
+def json_response(page: BaseModel) -> Response:
+    """Serialize an already validated page without FastAPI re-validating it."""
+    return Response(content=page.model_dump_json(), media_type="application/json")
+
+
+async def load_item_page(
+    db: AsyncSession, user_id: UUID, params: Params
+) -> Page[ItemRead]:
+    if settings.FAST_SERIALIZATION:
+        # Plain rows skip ORM hydration and the session identity map
+        query = select(*ITEM_COLUMNS).filter(Item.user_id == user_id).order_by(Item.id)
+        return await apaginate(db, query, params, transformer=transform_rows)
+    query = select(Item).filter(Item.user_id == user_id).order_by(Item.id)
+    return await apaginate(db, query, params, transformer=transform_items)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+@router.get(
+    "/",
+    response_model=Page[ItemRead],
+    responses={304: {"description": "Page unchanged since the given ETag"}},
+)
 async def read_item(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    if_none_match: str | None = Header(None),
 ):
     params = Params(page=page, size=size)
+    version = await item_list_cache.get_version(user.id)
+    if version is None:
+        items_page = await load_item_page(db, user.id, params)
+        if settings.FAST_SERIALIZATION:
+            return json_response(items_page)
+        return items_page
+
+    headers = {
+        "ETag": item_list_cache.etag(version, page, size),
+        "Cache-Control": "private, no-cache",
+    }
+    if etag_matches(if_none_match, headers["ETag"]):
+        # Answered from the version alone, without touching Postgres
+        item_list_cache.stats.not_modified += 1
+        return Response(status_code=304, headers=headers)
+
+    body = await item_list_cache.get_page(user.id, version, page, size)
+    if body is None:
+        body = (await load_item_page(db, user.id, params)).model_dump_json()
+        await item_list_cache.set_page(user.id, version, page, size, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/cursor", response_model=ItemCursorPage)
+async def read_item_cursor(
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    size: int = Query(10, ge=1, le=100, description="Page size"),
+    total: TotalMode = Query("none", description="Include an item count"),
+):
+    if settings.FAST_SERIALIZATION:
+        query = select(*ITEM_COLUMNS).filter(Item.user_id == user.id)
+        page = await keyset_paginate(db, query, Item.id, cursor, size, total)
+        page["items"] = transform_rows(page["items"])
+        return json_response(ItemCursorPage(**page))
     query = select(Item).filter(Item.user_id == user.id)
-    return await apaginate(db, query, params, transformer=transform_items)
+    page = await keyset_paginate(db, query, Item.id, cursor, size, total)
+    page["items"] = transform_items(page["items"])
+    return page
+
+
+def format_ndjson(rows) -> str:
+    return "".join(
+        json.dumps(
+            {
+                "id": str(row[0]),
+                "name": row[1],
+                "description": row[2],
+                "quantity": row[3],
+                "user_id": str(row[4]),
+            }
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+def format_csv(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+async def stream_items(
+    db: AsyncSession, user_id: UUID, export_format: str
+) -> AsyncIterator[str]:
+    formatter = format_csv if export_format == "csv" else format_ndjson
+    try:
+        if export_format == "csv":
+            yield format_csv([EXPORT_FIELDS])
+        query = (
+            select(*ITEM_COLUMNS)
+            .filter(Item.user_id == user_id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        # A server-side cursor keeps only one batch of rows in memory
+        result = await db.stream(query)
+        async for rows in result.partitions():
+            yield formatter(rows)
+    finally:
+        # The session dependency has already exited by the time the body is
+        # streamed, so release the connection held by the cursor here
+        await db.close()
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+)
+async def export_items(
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+):
+    """Stream all of the caller's items without paginating."""
+    return StreamingResponse(
+        stream_items(db, user.id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="items.{format}"'},
+    )
 
 
 @router.post("/", response_model=ItemRead)
@@ -39,10 +208,93 @@ async def create_item(
     db_item = Item(**item.model_dump(), user_id=user.id)
     db.add(db_item)
     await db.commit()
+    await item_list_cache.bump(user.id)
     await db.refresh(db_item)
     return db_item
 
 
+@router.post("/bulk", response_model=ItemBulkCreateResponse)
+async def create_items_bulk(
+    items: list[dict[str, Any]] = Body(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Items to create"
+    ),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    """Create many items in one INSERT ... RETURNING, reporting each row.
+
+    Rows failing validation are reported and skipped; the valid rows are
+    still created.
+    """
+    results: list[ItemBulkCreateResult] = []
+    rows: list[dict[str, Any]] = []
+    for index, raw_item in enumerate(items):
+        try:
+            item = ItemCreate.model_validate(raw_item)
+        except ValidationError as e:
+            errors = [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ]
+            results.append(ItemBulkCreateResult(index=index, errors=errors))
+            continue
+        rows.append({"id": uuid4(), **item.model_dump(), "user_id": user.id})
+        results.append(ItemBulkCreateResult(index=index))
+
+    created: dict[UUID, ItemRead] = {}
+    if rows:
+        returned = await db.execute(
+            insert(Item)
+            .values(rows)
+            .returning(
+                Item.id, Item.name, Item.description, Item.quantity, Item.user_id
+            )
+        )
+        created = {row.id: ItemRead.model_validate(row._mapping) for row in returned}
+        await db.commit()
+        await item_list_cache.bump(user.id)
+
+    row_ids = iter(row["id"] for row in rows)
+    for result in results:
+        if result.errors is None:
+            result.item = created[next(row_ids)]
+
+    return ItemBulkCreateResponse(
+        created=len(created), failed=len(items) - len(created), results=results
+    )
+
+
+@router.delete("/bulk", response_model=ItemBulkDeleteResponse)
+async def delete_items_bulk(
+    payload: ItemBulkDelete,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    """Delete the caller's items among ``ids`` in a single statement."""
+    ids = list(dict.fromkeys(payload.ids))
+    result = await db.execute(
+        delete(Item)
+        .where(
+            Item.id == any_(bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True)))),
+            Item.user_id == user.id,
+        )
+        .returning(Item.id)
+    )
+    deleted = set(result.scalars().all())
+    await db.commit()
+    if deleted:
+        await item_list_cache.bump(user.id)
+
+    return ItemBulkDeleteResponse(
+        deleted=len(deleted),
+        not_found=len(ids) - len(deleted),
+        results=[
+            ItemBulkDeleteResult(id=item_id, deleted=item_id in deleted)
+            for item_id in ids
+        ],
+    )
+
+
 @router.delete("/{item_id}")
 async def delete_item(
     item_id: UUID,
@@ -59,5 +311,6 @@ async def delete_item(
 
     await db.delete(item)
     await db.commit()
+    await item_list_cache.bump(user.id)
 
     return {"message": "Item successfully deleted"}
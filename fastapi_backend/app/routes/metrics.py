@@ -0,0 +1,41 @@
+"""Prometheus scrape endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.database import pool_metrics
+from app.metrics import render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def pool_metric_lines() -> list[str]:
+    counters = {
+        "db_pool_checkouts_total": (
+            "Connections checked out of the pool.",
+            pool_metrics.checkouts,
+        ),
+        "db_pool_checkout_timeouts_total": (
+            "Checkouts that timed out waiting for a connection.",
+            pool_metrics.timeouts,
+        ),
+        "db_pool_checkout_wait_seconds_total": (
+            "Total time spent waiting for pooled connections.",
+            pool_metrics.wait_seconds_total,
+        ),
+    }
+    lines = []
+    for name, (documentation, value) in counters.items():
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} counter"]
+        lines.append(f"{name} {value}")
+    return lines
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Request latency, per-request SQL and pool metrics in Prometheus format."""
+    return PlainTextResponse(
+        render_metrics(pool_metric_lines()), media_type=PROMETHEUS_CONTENT_TYPE
+    )
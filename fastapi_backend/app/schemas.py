@@ -1,7 +1,7 @@
 import uuid
 
 from fastapi_users import schemas
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 
 
@@ -32,3 +32,40 @@ class ItemRead(ItemBase):
     user_id: UUID
 
     model_config = {"from_attributes": True}
+
+
+class ItemCursorPage(BaseModel):
+    items: list[ItemRead]
+    size: int
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+BULK_MAX_ITEMS = 1000
+
+
+class ItemBulkCreateResult(BaseModel):
+    index: int
+    item: ItemRead | None = None
+    errors: list[str] | None = None
+
+
+class ItemBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[ItemBulkCreateResult]
+
+
+class ItemBulkDelete(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class ItemBulkDeleteResult(BaseModel):
+    id: UUID
+    deleted: bool
+
+
+class ItemBulkDeleteResponse(BaseModel):
+    deleted: int
+    not_found: int
+    results: list[ItemBulkDeleteResult]
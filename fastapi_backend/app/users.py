@@ -1,7 +1,7 @@
 import uuid
 import re
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from fastapi import Depends, Request
 from fastapi_users import (
@@ -17,7 +17,9 @@ from fastapi_users.authentication import (
     JWTStrategy,
 )
 from fastapi_users.db import SQLAlchemyUserDatabase
+from sqlalchemy.orm import make_transient_to_detached
 
+from .cache import user_cache
 from .config import settings
 from .database import get_user_db
 from .email import send_reset_password_email
@@ -31,6 +33,38 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     reset_password_token_secret = settings.RESET_PASSWORD_SECRET_KEY
     verification_token_secret = settings.VERIFICATION_SECRET_KEY
 
+    async def get(self, id: uuid.UUID) -> User:
+        cached = await user_cache.get(id)
+        if cached is None:
+            user = await super().get(id)
+            await user_cache.set(user)
+            return user
+
+        # Attach the cached row to this request's session without a SELECT so
+        # later updates flush against it like a normally loaded user
+        user = User(**cached)
+        make_transient_to_detached(user)
+        return await self.user_db.session.merge(user, load=False)
+
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: Dict[str, Any],
+        request: Optional[Request] = None,
+    ):
+        await user_cache.invalidate(user.id)
+
+    async def on_after_verify(self, user: User, request: Optional[Request] = None):
+        await user_cache.invalidate(user.id)
+
+    async def on_after_reset_password(
+        self, user: User, request: Optional[Request] = None
+    ):
+        await user_cache.invalidate(user.id)
+
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        await user_cache.invalidate(user.id)
+
     async def on_after_register(self, user: User, request: Optional[Request] = None):
         print(f"User {user.id} has registered.")
 
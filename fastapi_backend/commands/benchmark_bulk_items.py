@@ -0,0 +1,122 @@
+"""Compare per-item and bulk item endpoints for creating and deleting items.
+
+Runs the app in-process against the configured DATABASE_URL:
+
+    uv run python -m commands.benchmark_bulk_items --items 5000 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import time
+
+from dotenv import load_dotenv
+from fastapi_users.db import SQLAlchemyUserDatabase
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import build_engine, get_async_session, get_user_db
+from app.main import app
+from app.models import User
+from app.schemas import BULK_MAX_ITEMS
+from app.users import get_jwt_strategy
+from commands.benchmark_pool import cleanup_user, seed_user
+
+load_dotenv()
+
+
+def chunks(values, size):
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+async def per_item(client, headers, item_count, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(i):
+        async with semaphore:
+            response = await client.post(
+                "/items/", json={"name": f"Item {i}", "quantity": i}, headers=headers
+            )
+            response.raise_for_status()
+            return response.json()["id"]
+
+    async def remove(item_id):
+        async with semaphore:
+            response = await client.delete(f"/items/{item_id}", headers=headers)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    ids = await asyncio.gather(*(create(i) for i in range(item_count)))
+    create_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(remove(item_id) for item_id in ids))
+    return create_elapsed, time.perf_counter() - start
+
+
+async def bulk(client, headers, item_count):
+    items = [{"name": f"Item {i}", "quantity": i} for i in range(item_count)]
+    ids = []
+
+    start = time.perf_counter()
+    for batch in chunks(items, BULK_MAX_ITEMS):
+        response = await client.post("/items/bulk", json=batch, headers=headers)
+        response.raise_for_status()
+        ids.extend(result["item"]["id"] for result in response.json()["results"])
+    create_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for batch in chunks(ids, BULK_MAX_ITEMS):
+        response = await client.request(
+            "DELETE", "/items/bulk", json={"ids": batch}, headers=headers
+        )
+        response.raise_for_status()
+    return create_elapsed, time.perf_counter() - start
+
+
+async def main(item_count, concurrency):
+    engine = build_engine("container")
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_async_session():
+        async with session_maker() as session:
+            yield session
+
+    async def override_get_user_db():
+        async with session_maker() as session:
+            yield SQLAlchemyUserDatabase(session, User)
+
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[get_user_db] = override_get_user_db
+
+    user = await seed_user(session_maker, 0)
+    token = await get_jwt_strategy().write_token(user)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+            results = {
+                "per-item": await per_item(client, headers, item_count, concurrency),
+                "bulk": await bulk(client, headers, item_count),
+            }
+    finally:
+        await cleanup_user(session_maker, user.id)
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+    print(f"{'endpoint':<10}{'create items/s':>16}{'delete items/s':>16}")
+    for name, (create_elapsed, delete_elapsed) in results.items():
+        print(
+            f"{name:<10}{item_count / create_elapsed:>16.1f}"
+            f"{item_count / delete_elapsed:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.concurrency))
@@ -0,0 +1,104 @@
+"""Measure throughput and memory of GET /items/export on a large table.
+
+Seeds one user with ``--items`` rows (1M by default) in the configured
+DATABASE_URL and streams the export through the ASGI app, discarding the
+body as it arrives so only the server side is measured:
+
+    uv run python -m commands.benchmark_export --items 1000000 --format ndjson
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+
+from dotenv import load_dotenv
+
+from app.database import async_session_maker
+from app.main import app
+from app.users import get_jwt_strategy
+from commands.benchmark_pagination import seed_items
+from commands.benchmark_pool import cleanup_user, seed_user
+
+load_dotenv()
+
+
+def max_rss_mb():
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def export(token, export_format):
+    """Call the export endpoint and count the streamed bytes and lines."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/export",
+        "raw_path": b"/items/export",
+        "query_string": f"format={export_format}".encode(),
+        "root_path": "",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    totals = {"bytes": 0, "lines": 0, "status": None}
+    request_sent = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Like a real client, only disconnect once the response is complete
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            totals["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            totals["bytes"] += len(body)
+            totals["lines"] += body.count(b"\n")
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    return totals
+
+
+async def main(item_count, export_format):
+    user = await seed_user(async_session_maker, 0)
+    try:
+        await seed_items(user.id, item_count)
+        token = await get_jwt_strategy().write_token(user)
+
+        rss_before = max_rss_mb()
+        start = time.perf_counter()
+        totals = await export(token, export_format)
+        elapsed = time.perf_counter() - start
+    finally:
+        await cleanup_user(async_session_maker, user.id)
+
+    if totals["status"] != 200:
+        raise SystemExit(f"Export failed with status {totals['status']}")
+
+    print(f"format:          {export_format}")
+    print(f"rows:            {item_count}")
+    print(f"bytes streamed:  {totals['bytes']}")
+    print(f"elapsed:         {elapsed:.2f}s")
+    print(f"rows/s:          {item_count / elapsed:.0f}")
+    print(f"max RSS before:  {rss_before:.1f} MB")
+    print(f"max RSS after:   {max_rss_mb():.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.format))
@@ -0,0 +1,114 @@
+"""Compare OFFSET and keyset pagination latency on a large item table.
+
+Seeds one user with ``--items`` rows (1M by default) in the configured
+DATABASE_URL, then times page 1 and page ``--page`` of both GET /items/
+and GET /items/cursor:
+
+    uv run python -m commands.benchmark_pagination --items 1000000 --page 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from dotenv import load_dotenv
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select, text
+
+from app.database import async_session_maker
+from app.main import app
+from app.models import Item
+from app.pagination import encode_cursor
+from app.users import get_jwt_strategy
+from commands.benchmark_pool import cleanup_user, percentile, seed_user
+
+load_dotenv()
+
+PAGE_SIZE = 100
+
+
+async def seed_items(user_id, item_count):
+    async with async_session_maker() as session:
+        await session.execute(
+            text(
+                "INSERT INTO items (id, name, quantity, user_id) "
+                "SELECT gen_random_uuid(), 'Item ' || g, g % 1000, :user_id "
+                "FROM generate_series(1, :item_count) AS g"
+            ),
+            {"user_id": user_id, "item_count": item_count},
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE items"))
+
+
+async def cursor_for_page(user_id, page):
+    """Return the cursor a client would hold after walking to ``page``."""
+    if page == 1:
+        return None
+    async with async_session_maker() as session:
+        last_id = (
+            await session.execute(
+                select(Item.id)
+                .where(Item.user_id == user_id)
+                .order_by(Item.id)
+                .offset((page - 1) * PAGE_SIZE - 1)
+                .limit(1)
+            )
+        ).scalar_one()
+    return encode_cursor(last_id)
+
+
+async def time_requests(client, url, params, headers, repeat):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = await client.get(url, params=params, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return latencies
+
+
+async def main(item_count, deep_page, repeat):
+    user = await seed_user(async_session_maker, 0)
+    try:
+        await seed_items(user.id, item_count)
+        token = await get_jwt_strategy().write_token(user)
+        headers = {"Authorization": f"Bearer {token}"}
+        deep_cursor = await cursor_for_page(user.id, deep_page)
+
+        cases = [
+            ("offset", 1, "/items/", {"page": 1, "size": PAGE_SIZE}),
+            ("offset", deep_page, "/items/", {"page": deep_page, "size": PAGE_SIZE}),
+            ("cursor", 1, "/items/cursor", {"size": PAGE_SIZE}),
+            (
+                "cursor",
+                deep_page,
+                "/items/cursor",
+                {"size": PAGE_SIZE, "cursor": deep_cursor},
+            ),
+        ]
+
+        print(f"{'strategy':<10}{'page':>8}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+            for strategy, page, url, params in cases:
+                latencies = await time_requests(client, url, params, headers, repeat)
+                print(
+                    f"{strategy:<10}{page:>8}"
+                    f"{statistics.mean(latencies) * 1000:>10.2f}"
+                    f"{percentile(latencies, 50) * 1000:>10.2f}"
+                    f"{percentile(latencies, 99) * 1000:>10.2f}"
+                )
+    finally:
+        await cleanup_user(async_session_maker, user.id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.page, args.repeat))
@@ -0,0 +1,145 @@
+"""Compare GET /items/ latency between the serverless and container engines.
+
+Runs the app in-process against the configured DATABASE_URL once per
+deployment mode and prints p50/p99 latencies:
+
+    uv run python -m commands.benchmark_pool --requests 500 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from dotenv import load_dotenv
+from fastapi_users.db import SQLAlchemyUserDatabase
+from fastapi_users.password import PasswordHelper
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import build_engine, get_async_session, get_user_db
+from app.main import app
+from app.models import Item, User
+from app.users import get_jwt_strategy
+
+load_dotenv()
+
+MODES = ("serverless", "container")
+
+
+def percentile(samples, pct):
+    """Return the pct-th percentile of samples using nearest-rank."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def seed_user(session_maker, item_count):
+    user_id = uuid.uuid4()
+    async with session_maker() as session:
+        await session.execute(
+            insert(User).values(
+                id=user_id,
+                email=f"bench-{user_id}@example.com",
+                hashed_password=PasswordHelper().hash("Benchmark123#"),
+                is_active=True,
+                is_superuser=False,
+                is_verified=True,
+            )
+        )
+        if item_count:
+            await session.execute(
+                insert(Item),
+                [
+                    {"name": f"Item {i}", "quantity": i, "user_id": user_id}
+                    for i in range(item_count)
+                ],
+            )
+        await session.commit()
+        user = await session.get(User, user_id)
+    return user
+
+
+async def cleanup_user(session_maker, user_id):
+    async with session_maker() as session:
+        await session.execute(delete(Item).where(Item.user_id == user_id))
+        await session.execute(delete(User).where(User.id == user_id))
+        await session.commit()
+
+
+async def run_mode(mode, total_requests, concurrency, item_count):
+    engine = build_engine(mode)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_async_session():
+        async with session_maker() as session:
+            yield session
+
+    async def override_get_user_db():
+        async with session_maker() as session:
+            yield SQLAlchemyUserDatabase(session, User)
+
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[get_user_db] = override_get_user_db
+
+    user = await seed_user(session_maker, item_count)
+    token = await get_jwt_strategy().write_token(user)
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+
+            async def timed_request():
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.get("/items/?size=10", headers=headers)
+                    latencies.append(time.perf_counter() - start)
+                    response.raise_for_status()
+
+            # Warm up so the pooled engine is measured in its steady state
+            await asyncio.gather(*(timed_request() for _ in range(concurrency)))
+            latencies.clear()
+
+            started = time.perf_counter()
+            await asyncio.gather(*(timed_request() for _ in range(total_requests)))
+            elapsed = time.perf_counter() - started
+    finally:
+        await cleanup_user(session_maker, user.id)
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+    return {
+        "mode": mode,
+        "requests": total_requests,
+        "rps": total_requests / elapsed,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def main(total_requests, concurrency, item_count):
+    results = [
+        await run_mode(mode, total_requests, concurrency, item_count) for mode in MODES
+    ]
+    print(f"{'mode':<12}{'req/s':>10}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for result in results:
+        print(
+            f"{result['mode']:<12}{result['rps']:>10.1f}{result['mean_ms']:>10.2f}"
+            f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.items))
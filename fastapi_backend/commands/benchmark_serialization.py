@@ -0,0 +1,96 @@
+"""Micro-benchmark serializing one page of items without a database.
+
+Compares the default list path (ORM objects validated per row, re-validated
+against ``response_model`` and encoded with the stdlib encoder) with the
+FAST_SERIALIZATION path (plain rows validated once and dumped by pydantic):
+
+    uv run python -m commands.benchmark_serialization --size 100
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections import namedtuple
+
+from dotenv import load_dotenv
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from fastapi_pagination import Page, Params
+
+from app.models import Item
+from app.responses import DefaultJSONResponse
+from app.routes.items import (
+    ITEM_COLUMNS,
+    json_response,
+    transform_items,
+    transform_rows,
+)
+from app.schemas import ItemRead
+
+load_dotenv()
+
+ItemRow = namedtuple("ItemRow", [column.key for column in ITEM_COLUMNS])
+
+
+def build_rows(size):
+    user_id = uuid.uuid4()
+    return [
+        ItemRow(uuid.uuid4(), f"Item {i}", f"Description {i}", i, user_id)
+        for i in range(size)
+    ]
+
+
+async def default_path(response_field, response_class, rows, params):
+    # Mirrors read_item + FastAPI's serialize_response for ORM results
+    items = [Item(**row._asdict()) for row in rows]
+    page = Page.create(transform_items(items), params, total=len(rows))
+    content = await serialize_response(field=response_field, response_content=page)
+    return response_class(content).body
+
+
+async def fast_path(rows, params):
+    page = Page.create(transform_rows(rows), params, total=len(rows))
+    return json_response(page).body
+
+
+async def time_path(call, iterations):
+    # Warm up validators and encoders before timing
+    for _ in range(10):
+        await call()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (time.perf_counter() - start) / iterations
+
+
+async def main(size, iterations):
+    rows = build_rows(size)
+    params = Params(page=1, size=size)
+    response_field = create_model_field("Response", Page[ItemRead])
+
+    paths = {
+        "default (stdlib json)": lambda: default_path(
+            response_field, JSONResponse, rows, params
+        ),
+        f"default ({DefaultJSONResponse.__name__})": lambda: default_path(
+            response_field, DefaultJSONResponse, rows, params
+        ),
+        "fast serialization": lambda: fast_path(rows, params),
+    }
+    results = {name: await time_path(call, iterations) for name, call in paths.items()}
+
+    baseline = next(iter(results.values()))
+    print(f"page size: {size}, iterations: {iterations}")
+    print(f"{'path':<28}{'us/page':>10}{'speedup':>10}")
+    for name, seconds in results.items():
+        print(f"{name:<28}{seconds * 1e6:>10.1f}{baseline / seconds:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.size, args.iterations))
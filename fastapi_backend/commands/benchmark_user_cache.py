@@ -0,0 +1,94 @@
+"""Measure authenticated request throughput with and without the user cache.
+
+Drives GET /users/me, which does nothing beyond authentication, in-process
+against the configured DATABASE_URL and REDIS_URL:
+
+    uv run python -m commands.benchmark_user_cache --requests 2000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from dotenv import load_dotenv
+from fastapi_users.db import SQLAlchemyUserDatabase
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.cache import user_cache
+from app.database import build_engine, get_async_session, get_user_db
+from app.main import app
+from app.models import User
+from app.users import get_jwt_strategy
+from commands.benchmark_pool import cleanup_user, percentile, seed_user
+
+load_dotenv()
+
+
+async def run(client, headers, total_requests, concurrency):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed_request():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get("/users/me", headers=headers)
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed_request() for _ in range(total_requests)))
+    elapsed = time.perf_counter() - started
+    return total_requests / elapsed, latencies
+
+
+async def main(total_requests, concurrency):
+    engine = build_engine("container")
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_async_session():
+        async with session_maker() as session:
+            yield session
+
+    async def override_get_user_db():
+        async with session_maker() as session:
+            yield SQLAlchemyUserDatabase(session, User)
+
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[get_user_db] = override_get_user_db
+
+    user = await seed_user(session_maker, 0)
+    token = await get_jwt_strategy().write_token(user)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print(f"{'cache':<10}{'req/s':>10}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+            for enabled in (False, True):
+                user_cache.clear()
+                user_cache.enabled = enabled
+                # Warm up connections (and the cache, when enabled)
+                await run(client, headers, concurrency, concurrency)
+                rps, latencies = await run(client, headers, total_requests, concurrency)
+                print(
+                    f"{'on' if enabled else 'off':<10}{rps:>10.1f}"
+                    f"{statistics.mean(latencies) * 1000:>10.2f}"
+                    f"{percentile(latencies, 50) * 1000:>10.2f}"
+                    f"{percentile(latencies, 99) * 1000:>10.2f}"
+                )
+            print(f"cache stats: {user_cache.stats.as_dict()}")
+    finally:
+        await cleanup_user(session_maker, user.id)
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,37 @@
+"""Run the email outbox worker as a standalone process.
+
+Use this when the API runs with EMAIL_WORKER_IN_PROCESS=False, e.g. to keep a
+single worker draining the outbox for several API replicas:
+
+    uv run python -m commands.email_worker
+"""
+
+import asyncio
+import logging
+import signal
+
+from dotenv import load_dotenv
+
+from app.email_outbox import EmailWorker
+from app.redis_client import close_redis, get_redis
+
+load_dotenv()
+
+
+async def main():
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print("Email worker started.")
+    try:
+        await EmailWorker(get_redis()).run(stop)
+    finally:
+        await close_redis()
+    print("Email worker stopped.")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
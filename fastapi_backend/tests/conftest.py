@@ -1,14 +1,30 @@
 from httpx import AsyncClient, ASGITransport
+import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from fastapi_users.db import SQLAlchemyUserDatabase
 
+from app import redis_client
+from app.cache import item_list_cache, user_cache
 from app.config import settings
 from app.models import User, Base
 
 from app.database import get_user_db, get_async_session
 from app.main import app
 from app.users import get_jwt_strategy
+from tests.fake_redis import FakeRedis
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    """Back the shared Redis client with an in-memory fake for every test."""
+    client = FakeRedis()
+    monkeypatch.setattr(redis_client, "_client", client)
+    user_cache.clear()
+    item_list_cache.clear()
+    yield client
+    user_cache.clear()
+    item_list_cache.clear()
 
 
 # Factory-boy integration - use async factory pattern
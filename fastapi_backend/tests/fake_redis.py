@@ -0,0 +1,83 @@
+"""In-memory stand-in for the subset of ``redis.asyncio.Redis`` the app uses."""
+
+import time
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.expires_at = {}
+
+    def _purge(self, key):
+        expires_at = self.expires_at.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+
+    async def ping(self):
+        return True
+
+    async def get(self, key):
+        self._purge(key)
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        self._purge(key)
+        if nx and key in self.data:
+            return None
+        # Like decode_responses=True, values come back as strings
+        self.data[key] = value if isinstance(value, str) else str(value)
+        if ex is not None:
+            self.expires_at[key] = time.monotonic() + ex
+        else:
+            self.expires_at.pop(key, None)
+        return True
+
+    async def incr(self, key):
+        self._purge(key)
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            if key in self.data:
+                removed += 1
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+        return removed
+
+    async def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+        return len(self.data[key])
+
+    async def lpop(self, key, count=None):
+        items = self.data.get(key) or []
+        if not items:
+            return None
+        if count is None:
+            return items.pop(0)
+        popped, self.data[key] = items[:count], items[count:]
+        return popped
+
+    async def lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    async def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zrangebyscore(self, key, min_score, max_score):
+        members = self.data.get(key, {})
+        return sorted(
+            (m for m, score in members.items() if min_score <= score <= max_score),
+            key=members.get,
+        )
+
+    async def zrem(self, key, *members):
+        zset = self.data.get(key, {})
+        return sum(zset.pop(member, None) is not None for member in members)
+
+    async def aclose(self):
+        pass
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import status
+
+from app.routes import health
+from app.routes.health import probe_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_probe_cache():
+    probe_cache.reset()
+    yield
+    probe_cache.reset()
+
+
+@pytest.fixture
+def mock_probes(mocker):
+    postgres = mocker.patch.object(
+        health, "check_postgres", mocker.AsyncMock(return_value="ok")
+    )
+    redis = mocker.patch.object(
+        health, "check_redis", mocker.AsyncMock(return_value="ok")
+    )
+    return postgres, redis
+
+
+class TestHealth:
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_readiness_ok(self, test_client, mock_probes):
+        response = await test_client.get("/health/ready")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"status": "ready", "postgres": "ok", "redis": "ok"}
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_readiness_not_ready_returns_503(self, test_client, mock_probes):
+        mock_probes[1].return_value = "error: connection refused"
+
+        response = await test_client.get("/health/ready")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["status"] == "not_ready"
+        assert response.json()["redis"] == "error: connection refused"
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_health_reports_unhealthy(self, test_client, mock_probes):
+        mock_probes[0].return_value = "error: down"
+
+        response = await test_client.get("/health")
+
+        assert response.json()["status"] == "unhealthy"
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_probes_run_concurrently(self, test_client, mocker):
+        async def slow_ok():
+            await asyncio.sleep(0.2)
+            return "ok"
+
+        mocker.patch.object(health, "check_postgres", slow_ok)
+        mocker.patch.object(health, "check_redis", slow_ok)
+
+        start = time.perf_counter()
+        response = await test_client.get("/health/ready")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert time.perf_counter() - start < 0.35
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_slow_probe_times_out(self, test_client, mock_probes, mocker):
+        async def hang():
+            await asyncio.sleep(10)
+
+        mocker.patch.object(health, "check_redis", hang)
+        mocker.patch.object(health.settings, "HEALTH_PROBE_TIMEOUT_SECONDS", 0.05)
+
+        response = await test_client.get("/health/ready")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["redis"] == "error: timeout"
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_probe_bursts_share_one_check(self, test_client, mock_probes):
+        responses = await asyncio.gather(
+            *(test_client.get("/health/ready") for _ in range(10))
+        )
+
+        assert all(r.status_code == status.HTTP_200_OK for r in responses)
+        assert mock_probes[0].await_count == 1
+        assert mock_probes[1].await_count == 1
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_probe_result_expires(self, test_client, mock_probes, mocker):
+        clock = mocker.patch.object(health.time, "monotonic", return_value=100.0)
+        await test_client.get("/health/ready")
+
+        clock.return_value = 100.0 + probe_cache.ttl_seconds + 0.1
+        await test_client.get("/health/ready")
+
+        assert mock_probes[0].await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_check_redis_uses_shared_client(self, fake_redis, mocker):
+        ping = mocker.spy(fake_redis, "ping")
+
+        assert await health.check_redis() == "ok"
+        ping.assert_awaited_once()
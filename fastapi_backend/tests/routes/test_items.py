@@ -1,3 +1,7 @@
+import csv
+import io
+import json
+
 import pytest
 from fastapi import status
 from sqlalchemy import select, insert
@@ -132,3 +136,301 @@ class TestItems:
             "/items/00000000-0000-0000-0000-000000000000"
         )
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_read_items_cursor_walks_all_pages(
+        self, test_client, db_session, authenticated_user
+    ):
+        """Test keyset pagination returns every item exactly once."""
+        user_id = authenticated_user["user"].id
+        await db_session.execute(
+            insert(Item),
+            [{"name": f"Item {i}", "user_id": user_id} for i in range(7)],
+        )
+        await db_session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"size": 3}
+            if cursor:
+                params["cursor"] = cursor
+            response = await test_client.get(
+                "/items/cursor", params=params, headers=authenticated_user["headers"]
+            )
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            assert page["total"] is None
+            seen.extend(item["id"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert seen == sorted(seen)
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_read_items_cursor_totals(
+        self, test_client, db_session, authenticated_user
+    ):
+        """Test exact and approximate totals for keyset pagination."""
+        user_id = authenticated_user["user"].id
+        await db_session.execute(
+            insert(Item),
+            [{"name": f"Item {i}", "user_id": user_id} for i in range(4)],
+        )
+        await db_session.commit()
+
+        exact = await test_client.get(
+            "/items/cursor",
+            params={"total": "exact", "size": 2},
+            headers=authenticated_user["headers"],
+        )
+        assert exact.json()["total"] == 4
+        assert exact.json()["next_cursor"] is not None
+
+        approximate = await test_client.get(
+            "/items/cursor",
+            params={"total": "approximate"},
+            headers=authenticated_user["headers"],
+        )
+        assert isinstance(approximate.json()["total"], int)
+        assert approximate.json()["next_cursor"] is None
+
+    @pytest.mark.asyncio(loop_scope="function")
+    @pytest.mark.parametrize("path", ["/items/", "/items/cursor"])
+    async def test_fast_serialization_matches_default(
+        self, test_client, db_session, authenticated_user, monkeypatch, path
+    ):
+        """Test the plain-row serialization path returns identical payloads."""
+        monkeypatch.setattr("app.routes.items.item_list_cache.enabled", False)
+        user_id = authenticated_user["user"].id
+        await db_session.execute(
+            insert(Item),
+            [
+                {"name": f"Item {i}", "quantity": i, "user_id": user_id}
+                for i in range(5)
+            ],
+        )
+        await db_session.commit()
+        params = {"size": 3}
+        headers = authenticated_user["headers"]
+
+        default = await test_client.get(path, params=params, headers=headers)
+        monkeypatch.setattr("app.routes.items.settings.FAST_SERIALIZATION", True)
+        fast = await test_client.get(path, params=params, headers=headers)
+
+        assert fast.status_code == status.HTTP_200_OK
+        assert fast.headers["content-type"] == "application/json"
+        assert fast.json() == default.json()
+        assert len(fast.json()["items"]) == 3
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_read_items_invalid_cursor(self, test_client, authenticated_user):
+        """Test a malformed cursor is rejected."""
+        response = await test_client.get(
+            "/items/cursor",
+            params={"cursor": "not-a-cursor"},
+            headers=authenticated_user["headers"],
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_unauthorized_read_items_cursor(self, test_client):
+        """Test reading items by cursor without authentication."""
+        response = await test_client.get("/items/cursor")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_create_items_bulk(self, test_client, db_session, authenticated_user):
+        """Test creating many items in one request."""
+        items_data = [
+            {"name": "Bulk 1", "quantity": 1},
+            {"name": "Bulk 2", "description": "Second"},
+        ]
+        response = await test_client.post(
+            "/items/bulk", json=items_data, headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["created"] == 2
+        assert body["failed"] == 0
+        assert [r["item"]["name"] for r in body["results"]] == ["Bulk 1", "Bulk 2"]
+
+        items = (
+            (
+                await db_session.execute(
+                    select(Item).where(Item.user_id == authenticated_user["user"].id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert {item.name for item in items} == {"Bulk 1", "Bulk 2"}
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_create_items_bulk_reports_invalid_rows(
+        self, test_client, authenticated_user
+    ):
+        """Test invalid rows are reported while valid rows are created."""
+        items_data = [
+            {"name": "Valid"},
+            {"description": "Missing name"},
+            {"name": "Bad quantity", "quantity": "many"},
+        ]
+        response = await test_client.post(
+            "/items/bulk", json=items_data, headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["created"] == 1
+        assert body["failed"] == 2
+        results = body["results"]
+        assert results[0]["item"]["name"] == "Valid"
+        assert results[1]["item"] is None
+        assert results[1]["errors"][0].startswith("name:")
+        assert results[2]["errors"][0].startswith("quantity:")
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_create_items_bulk_limits_batch_size(
+        self, test_client, authenticated_user
+    ):
+        """Test empty and oversized batches are rejected."""
+        for items_data in ([], [{"name": "x"}] * 1001):
+            response = await test_client.post(
+                "/items/bulk", json=items_data, headers=authenticated_user["headers"]
+            )
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_delete_items_bulk(self, test_client, db_session, authenticated_user):
+        """Test deleting many items only removes the caller's items."""
+        from tests.factories import create_user_factory
+
+        other_user = await (await create_user_factory(db_session)).create()
+        own = (
+            (
+                await db_session.execute(
+                    insert(Item)
+                    .values(
+                        [
+                            {"name": "Own 1", "user_id": authenticated_user["user"].id},
+                            {"name": "Own 2", "user_id": authenticated_user["user"].id},
+                        ]
+                    )
+                    .returning(Item.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        other = (
+            await db_session.execute(
+                insert(Item)
+                .values(name="Other", user_id=other_user.id)
+                .returning(Item.id)
+            )
+        ).scalar_one()
+        await db_session.commit()
+        missing = "00000000-0000-0000-0000-000000000000"
+
+        response = await test_client.request(
+            "DELETE",
+            "/items/bulk",
+            json={"ids": [str(own[0]), str(own[1]), str(other), missing]},
+            headers=authenticated_user["headers"],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["deleted"] == 2
+        assert body["not_found"] == 2
+        assert [r["deleted"] for r in body["results"]] == [True, True, False, False]
+
+        remaining = (await db_session.execute(select(Item.id))).scalars().all()
+        assert remaining == [other]
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_unauthorized_bulk_endpoints(self, test_client):
+        """Test bulk endpoints without authentication."""
+        response = await test_client.post("/items/bulk", json=[{"name": "x"}])
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = await test_client.request(
+            "DELETE",
+            "/items/bulk",
+            json={"ids": ["00000000-0000-0000-0000-000000000000"]},
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_export_items_ndjson(
+        self, test_client, db_session, authenticated_user
+    ):
+        """Test exporting every item of the caller as NDJSON."""
+        from tests.factories import create_user_factory
+
+        user_id = authenticated_user["user"].id
+        other_user = await (await create_user_factory(db_session)).create()
+        await db_session.execute(
+            insert(Item),
+            [{"name": f"Item {i}", "quantity": i, "user_id": user_id} for i in range(5)]
+            + [{"name": "Other", "user_id": other_user.id}],
+        )
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/items/export", headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(row["name"] for row in rows) == [f"Item {i}" for i in range(5)]
+        assert {row["user_id"] for row in rows} == {str(user_id)}
+        assert set(rows[0]) == {"id", "name", "description", "quantity", "user_id"}
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_export_items_csv(self, test_client, db_session, authenticated_user):
+        """Test exporting items as CSV."""
+        await db_session.execute(
+            insert(Item).values(
+                name="Comma, item",
+                description=None,
+                quantity=3,
+                user_id=authenticated_user["user"].id,
+            )
+        )
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/items/export",
+            params={"format": "csv"},
+            headers=authenticated_user["headers"],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Comma, item"
+        assert rows[0]["description"] == ""
+        assert rows[0]["quantity"] == "3"
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_export_items_invalid_format(self, test_client, authenticated_user):
+        """Test unsupported export formats are rejected."""
+        response = await test_client.get(
+            "/items/export",
+            params={"format": "xml"},
+            headers=authenticated_user["headers"],
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_unauthorized_export_items(self, test_client):
+        """Test exporting items without authentication."""
+        response = await test_client.get("/items/export")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
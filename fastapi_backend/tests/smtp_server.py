@@ -0,0 +1,57 @@
+"""Minimal local SMTP server used as a stand-in for a real mail server."""
+
+import asyncio
+from email import message_from_bytes, policy
+
+
+class LocalSMTPServer:
+    """Accept SMTP sessions on localhost and keep every delivered message."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.messages = []
+        self.connections = 0
+        self._server = None
+        self.port = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _reply(self, writer, line):
+        writer.write(f"{line}\r\n".encode())
+        await writer.drain()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        await self._reply(writer, "220 localhost ESMTP test server")
+        try:
+            while line := await reader.readline():
+                command = line.decode().strip()
+                verb = command.split(" ", 1)[0].upper()
+                if verb == "EHLO":
+                    writer.write(b"250-localhost\r\n250 8BITMIME\r\n")
+                    await writer.drain()
+                elif verb == "DATA":
+                    await self._reply(writer, "354 End data with <CR><LF>.<CR><LF>")
+                    data = b""
+                    while (chunk := await reader.readline()) != b".\r\n":
+                        data += chunk[1:] if chunk.startswith(b"..") else chunk
+                    await asyncio.sleep(self.delay)
+                    self.messages.append(
+                        message_from_bytes(data, policy=policy.default)
+                    )
+                    await self._reply(writer, "250 OK: queued")
+                elif verb == "QUIT":
+                    await self._reply(writer, "221 Bye")
+                    break
+                else:
+                    # HELO, MAIL, RCPT, RSET and NOOP need no state here
+                    await self._reply(writer, "250 OK")
+        finally:
+            writer.close()
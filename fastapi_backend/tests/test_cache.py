@@ -0,0 +1,338 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import status
+from fastapi_users.db import SQLAlchemyUserDatabase
+from httpx import ASGITransport, AsyncClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.cache import ItemListCache, LRUCache, UserCache, item_list_cache, user_cache
+from app.database import get_async_session, get_user_db
+from app.main import app
+from app.models import User
+
+
+@pytest.fixture
+def user():
+    return User(
+        id=uuid.uuid4(),
+        email="cached@example.com",
+        hashed_password="hashed",
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+    )
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_expires_entries(mocker):
+    clock = mocker.patch("app.cache.time.monotonic", return_value=100.0)
+    cache = LRUCache(max_size=2, ttl_seconds=5)
+    cache.set("a", 1)
+
+    clock.return_value = 104.0
+    assert cache.get("a") == 1
+
+    clock.return_value = 106.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_user_cache_tiers(user, fake_redis):
+    cache = UserCache()
+
+    assert await cache.get(user.id) is None
+    await cache.set(user)
+
+    assert (await cache.get(user.id))["email"] == user.email
+    assert cache.stats.local_hits == 1
+
+    # A second process only shares the Redis tier
+    other = UserCache()
+    fields = await other.get(user.id)
+    assert fields["id"] == user.id
+    assert fields["is_active"] is True
+    assert other.stats.redis_hits == 1
+
+    await cache.invalidate(user.id)
+    assert await cache.get(user.id) is None
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_user_cache_survives_redis_errors(user, fake_redis, mocker):
+    mocker.patch.object(fake_redis, "get", side_effect=RedisConnectionError("down"))
+    mocker.patch.object(fake_redis, "set", side_effect=RedisConnectionError("down"))
+    cache = UserCache()
+
+    assert await cache.get(user.id) is None
+    await cache.set(user)
+
+    assert (await cache.get(user.id))["email"] == user.email
+    assert cache.stats.errors == 2
+
+
+@pytest.mark.asyncio
+async def test_user_cache_disabled(user):
+    cache = UserCache()
+    cache.enabled = False
+    await cache.set(user)
+
+    assert await cache.get(user.id) is None
+    assert cache.stats.misses == 0
+
+
+class TestAuthenticatedUserCache:
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_repeated_requests_hit_cache(self, test_client, authenticated_user):
+        headers = authenticated_user["headers"]
+
+        first = await test_client.get("/users/me", headers=headers)
+        second = await test_client.get("/users/me", headers=headers)
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert second.json() == first.json()
+        assert user_cache.stats.misses == 1
+        assert user_cache.stats.local_hits == 1
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_update_invalidates_cache(self, test_client, authenticated_user):
+        headers = authenticated_user["headers"]
+        await test_client.get("/users/me", headers=headers)
+
+        response = await test_client.patch(
+            "/users/me", json={"email": "renamed@example.com"}, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await test_client.get("/users/me", headers=headers)
+        assert response.json()["email"] == "renamed@example.com"
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_deactivated_user_is_rejected(
+        self, test_client, db_session, authenticated_user
+    ):
+        from tests.factories import create_user_factory
+        from app.users import get_jwt_strategy
+
+        factory = await create_user_factory(db_session)
+        admin = await factory.create(is_superuser=True)
+        admin_token = await get_jwt_strategy().write_token(admin)
+        headers = authenticated_user["headers"]
+        user_id = authenticated_user["user"].id
+
+        assert (await test_client.get("/users/me", headers=headers)).status_code == 200
+
+        response = await test_client.patch(
+            f"/users/{user_id}",
+            json={"is_active": False},
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await test_client.get("/users/me", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_item_list_cache_bump_hides_pages_stored_by_slow_readers():
+    cache = ItemListCache()
+    user_id = uuid.uuid4()
+
+    # A reader picks up the version, then a writer commits and bumps
+    read_version = await cache.get_version(user_id)
+    await cache.bump(user_id)
+    await cache.set_page(user_id, read_version, 1, 10, '{"stale": true}')
+
+    current = await cache.get_version(user_id)
+    assert current == read_version + 1
+    assert await cache.get_page(user_id, current, 1, 10) is None
+
+
+@pytest.mark.asyncio
+async def test_item_list_cache_lost_version_does_not_revive_pages(fake_redis):
+    cache = ItemListCache()
+    user_id = uuid.uuid4()
+    version = await cache.get_version(user_id)
+    await cache.set_page(user_id, version, 1, 10, '{"old": true}')
+
+    # e.g. evicted under memory pressure
+    await fake_redis.delete(cache._version_key(user_id))
+    await cache.bump(user_id)
+
+    new_version = await cache.get_version(user_id)
+    assert new_version != version
+    assert await cache.get_page(user_id, new_version, 1, 10) is None
+
+
+@pytest.mark.asyncio
+async def test_item_list_cache_concurrent_bumps_are_all_counted():
+    cache = ItemListCache()
+    user_id = uuid.uuid4()
+    start = await cache.get_version(user_id)
+
+    await asyncio.gather(*(cache.bump(user_id) for _ in range(50)))
+
+    assert await cache.get_version(user_id) == start + 50
+
+
+@pytest.mark.asyncio
+async def test_item_list_cache_disabled_without_redis(fake_redis, mocker):
+    mocker.patch.object(fake_redis, "get", side_effect=RedisConnectionError("down"))
+    cache = ItemListCache()
+
+    assert await cache.get_version(uuid.uuid4()) is None
+    assert cache.stats.errors == 1
+
+
+@pytest.fixture
+async def concurrent_client(engine):
+    """Client whose requests each get their own session, so they can overlap."""
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_async_session():
+        async with session_maker() as session:
+            yield session
+
+    async def override_get_user_db():
+        async with session_maker() as session:
+            yield SQLAlchemyUserDatabase(session, User)
+
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[get_user_db] = override_get_user_db
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://localhost:8000"
+    ) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+class TestItemListCache:
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_etag_and_not_modified(self, test_client, authenticated_user, mocker):
+        """Test repeat reads are served from Redis and 304s skip Postgres."""
+        headers = authenticated_user["headers"]
+        await test_client.post("/items/", json={"name": "Cached"}, headers=headers)
+
+        first = await test_client.get("/items/", headers=headers)
+        assert first.status_code == status.HTTP_200_OK
+        etag = first.headers["etag"]
+        assert etag.startswith('"items-')
+
+        load_item_page = mocker.patch("app.routes.items.load_item_page")
+        second = await test_client.get("/items/", headers=headers)
+        assert second.json() == first.json()
+        assert second.headers["etag"] == etag
+
+        not_modified = await test_client.get(
+            "/items/", headers={**headers, "If-None-Match": etag}
+        )
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.headers["etag"] == etag
+        assert not_modified.content == b""
+        load_item_page.assert_not_called()
+
+        stats = item_list_cache.stats.as_dict()
+        assert (stats["misses"], stats["hits"], stats["not_modified"]) == (1, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_writes_invalidate_pages(self, test_client, authenticated_user):
+        """Test every item writer changes the ETag and the cached page."""
+        headers = authenticated_user["headers"]
+        listing = await test_client.get("/items/", headers=headers)
+
+        created = await test_client.post(
+            "/items/", json={"name": "One"}, headers=headers
+        )
+        after_create = await test_client.get(
+            "/items/", headers={**headers, "If-None-Match": listing.headers["etag"]}
+        )
+        assert after_create.status_code == status.HTTP_200_OK
+        assert after_create.json()["total"] == 1
+
+        await test_client.post("/items/bulk", json=[{"name": "Two"}], headers=headers)
+        after_bulk = await test_client.get("/items/", headers=headers)
+        assert after_bulk.json()["total"] == 2
+
+        await test_client.delete(f"/items/{created.json()['id']}", headers=headers)
+        after_delete = await test_client.get("/items/", headers=headers)
+        assert after_delete.json()["total"] == 1
+
+        ids = [item["id"] for item in after_delete.json()["items"]]
+        await test_client.request(
+            "DELETE", "/items/bulk", json={"ids": ids}, headers=headers
+        )
+        after_bulk_delete = await test_client.get("/items/", headers=headers)
+        assert after_bulk_delete.json()["total"] == 0
+
+        etags = {
+            response.headers["etag"]
+            for response in (
+                listing,
+                after_create,
+                after_bulk,
+                after_delete,
+                after_bulk_delete,
+            )
+        }
+        assert len(etags) == 5
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_consistent_under_concurrent_writes(
+        self, concurrent_client, authenticated_user
+    ):
+        """Test no stale page survives writes racing with cached reads."""
+        headers = authenticated_user["headers"]
+        writes = 20
+
+        async def create(i):
+            response = await concurrent_client.post(
+                "/items/", json={"name": f"Item {i}"}, headers=headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        async def read():
+            response = await concurrent_client.get(
+                "/items/", params={"size": 100}, headers=headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        await asyncio.gather(
+            *(create(i) for i in range(writes)), *(read() for _ in range(writes))
+        )
+
+        final = await concurrent_client.get(
+            "/items/", params={"size": 100}, headers=headers
+        )
+        assert final.json()["total"] == writes
+        assert len(final.json()["items"]) == writes
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_served_uncached_when_redis_is_down(
+        self, test_client, authenticated_user, fake_redis, mocker
+    ):
+        """Test listings still work, without an ETag, when Redis fails."""
+        headers = authenticated_user["headers"]
+        await test_client.get("/users/me", headers=headers)
+        mocker.patch.object(fake_redis, "get", side_effect=RedisConnectionError("down"))
+
+        response = await test_client.get("/items/", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "etag" not in response.headers
+        assert response.json()["items"] == []
@@ -1,12 +1,18 @@
 import pytest
+from sqlalchemy import NullPool, text
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
 from fastapi_users.db import SQLAlchemyUserDatabase
 
+from app.config import settings
 from app.database import (
+    InstrumentedAsyncQueuePool,
     async_session_maker,
+    build_engine,
     create_db_and_tables,
     get_async_session,
+    get_engine_options,
     get_user_db,
+    pool_metrics,
 )
 from app.models import Base, User
 
@@ -106,3 +112,45 @@ async def test_session_maker_configuration():
     # Create a test session
     async with async_session_maker() as session:
         assert isinstance(session, AsyncSession)
+
+
+def test_engine_options_serverless_disables_pooling():
+    assert get_engine_options("serverless") == {"poolclass": NullPool}
+
+
+def test_engine_options_container_uses_pool(mocker):
+    mock_settings = mocker.patch("app.database.settings")
+    mock_settings.DATABASE_POOL_SIZE = 5
+    mock_settings.DATABASE_MAX_OVERFLOW = 2
+    mock_settings.DATABASE_POOL_TIMEOUT = 3.0
+    mock_settings.DATABASE_POOL_RECYCLE = 600
+    mock_settings.DATABASE_POOL_PRE_PING = True
+    mock_settings.DATABASE_STATEMENT_CACHE_SIZE = 50
+
+    options = get_engine_options("container")
+
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["pool_size"] == 5
+    assert options["max_overflow"] == 2
+    assert options["pool_timeout"] == 3.0
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {"prepared_statement_cache_size": 50}
+
+
+@pytest.mark.asyncio
+async def test_container_engine_records_checkouts():
+    engine = build_engine("container", settings.TEST_DATABASE_URL)
+    pool_metrics.reset()
+    try:
+        for _ in range(3):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        assert isinstance(engine.pool, InstrumentedAsyncQueuePool)
+        assert engine.pool.checkedin() == 1
+        assert pool_metrics.checkouts == 3
+        assert pool_metrics.wait_seconds_max >= 0
+    finally:
+        pool_metrics.reset()
+        await engine.dispose()
@@ -1,6 +1,8 @@
 import pytest
 from pathlib import Path
 from fastapi_mail import ConnectionConfig, MessageSchema
+from redis.exceptions import ConnectionError as RedisConnectionError
+
 from app.email import get_email_config, send_reset_password_email
 from app.models import User
 
@@ -21,6 +23,7 @@ def mock_settings(mocker):
     mock.VALIDATE_CERTS = True
     mock.TEMPLATE_DIR = "email_templates"
     mock.FRONTEND_URL = "http://test-frontend.com"
+    mock.EMAIL_DELIVERY = "outbox"
     return mock
 
 
@@ -48,8 +51,44 @@ def test_get_email_config(mock_settings):
     assert isinstance(config.TEMPLATE_FOLDER, Path)
 
 
+@pytest.mark.asyncio
+async def test_send_reset_password_email_enqueues(mock_settings, mock_user, mocker):
+    mock_enqueue = mocker.patch("app.email.enqueue_email")
+    mock_fastmail = mocker.patch("app.email.FastMail")
+
+    await send_reset_password_email(mock_user, "test-token-123")
+
+    mock_fastmail.assert_not_called()
+    _, recipients, subject, template_name, context = mock_enqueue.call_args[0]
+    assert recipients == [mock_user.email]
+    assert subject == "Password recovery"
+    assert template_name == "password_reset.html"
+    assert context == {
+        "username": mock_user.email,
+        "link": "http://test-frontend.com/password-recovery/confirm?token=test-token-123",
+    }
+
+
+@pytest.mark.asyncio
+async def test_send_reset_password_email_inline(mock_settings, mock_user, mocker):
+    mock_settings.EMAIL_DELIVERY = "inline"
+    mock_enqueue = mocker.patch("app.email.enqueue_email")
+    mock_fastmail = mocker.patch("app.email.FastMail")
+    mock_fastmail.return_value.send_message = mocker.AsyncMock()
+
+    await send_reset_password_email(mock_user, "test-token-123")
+
+    mock_enqueue.assert_not_called()
+    mock_fastmail.return_value.send_message.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_send_reset_password_email(mock_settings, mock_user, mocker):
+    # Redis being unavailable falls back to sending inline
+    mocker.patch(
+        "app.email.enqueue_email", side_effect=RedisConnectionError("unavailable")
+    )
+
     # Mock FastMail
     mock_fastmail = mocker.patch("app.email.FastMail")
     mock_fastmail_instance = mock_fastmail.return_value
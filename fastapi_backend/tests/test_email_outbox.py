@@ -0,0 +1,170 @@
+import json
+import time
+
+import pytest
+from fastapi import status
+
+from app.email_outbox import (
+    DEAD_LETTER_KEY,
+    OUTBOX_KEY,
+    RETRY_KEY,
+    EmailWorker,
+    enqueue_email,
+    render_template,
+)
+from tests.smtp_server import LocalSMTPServer
+
+
+@pytest.fixture
+async def smtp_server():
+    server = await LocalSMTPServer().start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+def mail_settings(mocker, smtp_server):
+    mock = mocker.patch("app.email_outbox.settings")
+    mock.MAIL_SERVER = "127.0.0.1"
+    mock.MAIL_PORT = smtp_server.port
+    mock.MAIL_FROM = "noreply@example.com"
+    mock.MAIL_FROM_NAME = "Test Sender"
+    mock.MAIL_USERNAME = None
+    mock.MAIL_PASSWORD = None
+    mock.USE_CREDENTIALS = False
+    mock.MAIL_SSL_TLS = False
+    mock.MAIL_STARTTLS = False
+    mock.VALIDATE_CERTS = False
+    mock.EMAIL_BATCH_SIZE = 10
+    mock.EMAIL_MAX_ATTEMPTS = 3
+    mock.EMAIL_RETRY_BACKOFF_SECONDS = 2.0
+    mock.EMAIL_POLL_INTERVAL_SECONDS = 0.01
+    mock.EMAIL_SMTP_IDLE_TIMEOUT_SECONDS = 30.0
+    return mock
+
+
+async def enqueue_reset(redis, recipient):
+    return await enqueue_email(
+        redis,
+        [recipient],
+        "Password recovery",
+        "password_reset.html",
+        {"username": recipient, "link": f"http://frontend/reset?user={recipient}"},
+    )
+
+
+def test_render_template():
+    html = render_template(
+        "password_reset.html", {"username": "a@example.com", "link": "http://x/?a=1"}
+    )
+
+    assert "Hello a@example.com" in html
+    assert 'href="http://x/?a=1"' in html
+
+
+@pytest.mark.asyncio
+async def test_enqueue_email(fake_redis):
+    message_id = await enqueue_reset(fake_redis, "a@example.com")
+
+    [raw] = await fake_redis.lrange(OUTBOX_KEY, 0, -1)
+    payload = json.loads(raw)
+    assert payload["id"] == message_id
+    assert payload["recipients"] == ["a@example.com"]
+    assert payload["attempts"] == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_sends_batch_over_one_connection(
+    fake_redis, smtp_server, mail_settings
+):
+    for i in range(5):
+        await enqueue_reset(fake_redis, f"user{i}@example.com")
+    worker = EmailWorker(fake_redis)
+
+    sent = await worker.run_once()
+    await worker.close()
+
+    assert sent == 5
+    assert smtp_server.connections == 1
+    assert [m["To"] for m in smtp_server.messages] == [
+        f"user{i}@example.com" for i in range(5)
+    ]
+    assert smtp_server.messages[0]["Subject"] == "Password recovery"
+    assert "reset?user=user0@example.com" in smtp_server.messages[0].get_content()
+    assert await fake_redis.lrange(OUTBOX_KEY, 0, -1) == []
+
+
+@pytest.mark.asyncio
+async def test_worker_keeps_connection_between_batches(
+    fake_redis, smtp_server, mail_settings
+):
+    worker = EmailWorker(fake_redis)
+
+    await enqueue_reset(fake_redis, "first@example.com")
+    await worker.run_once()
+    await enqueue_reset(fake_redis, "second@example.com")
+    await worker.run_once()
+    await worker.close()
+
+    assert len(smtp_server.messages) == 2
+    assert smtp_server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_with_backoff(fake_redis, smtp_server, mail_settings):
+    await smtp_server.stop()
+    await enqueue_reset(fake_redis, "a@example.com")
+    worker = EmailWorker(fake_redis)
+
+    before = time.time()
+    assert await worker.run_once() == 0
+
+    [(raw, due)] = fake_redis.data[RETRY_KEY].items()
+    assert json.loads(raw)["attempts"] == 1
+    assert before + 2.0 <= due <= time.time() + 2.0
+
+    # Not due yet: nothing is promoted back to the outbox
+    await worker.promote_due_retries()
+    assert await fake_redis.lrange(OUTBOX_KEY, 0, -1) == []
+
+    fake_redis.data[RETRY_KEY][raw] = 0
+    await worker.run_once()
+    [(raw, due)] = fake_redis.data[RETRY_KEY].items()
+    assert json.loads(raw)["attempts"] == 2
+    assert due >= time.time() + 3.0
+
+
+@pytest.mark.asyncio
+async def test_worker_dead_letters_after_max_attempts(
+    fake_redis, smtp_server, mail_settings
+):
+    await smtp_server.stop()
+    await enqueue_reset(fake_redis, "a@example.com")
+    worker = EmailWorker(fake_redis)
+
+    for _ in range(mail_settings.EMAIL_MAX_ATTEMPTS):
+        await worker.run_once()
+        for raw in list(fake_redis.data.get(RETRY_KEY, {})):
+            fake_redis.data[RETRY_KEY][raw] = 0
+
+    [raw] = await fake_redis.lrange(DEAD_LETTER_KEY, 0, -1)
+    assert json.loads(raw)["attempts"] == mail_settings.EMAIL_MAX_ATTEMPTS
+    assert fake_redis.data[RETRY_KEY] == {}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_forgot_password_does_not_wait_for_smtp(
+    test_client, authenticated_user, fake_redis, mocker
+):
+    send_email_now = mocker.patch("app.email.send_email_now")
+
+    start = time.perf_counter()
+    response = await test_client.post(
+        "/auth/forgot-password", json={"email": authenticated_user["user"].email}
+    )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert time.perf_counter() - start < 1
+    send_email_now.assert_not_called()
+    [raw] = await fake_redis.lrange(OUTBOX_KEY, 0, -1)
+    assert json.loads(raw)["recipients"] == [authenticated_user["user"].email]
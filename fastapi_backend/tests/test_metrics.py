@@ -0,0 +1,171 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import insert
+
+from app.metrics import (
+    Histogram,
+    MetricsMiddleware,
+    RequestStats,
+    _after_cursor_execute,
+    _before_cursor_execute,
+    _request_stats,
+    install_query_hooks,
+    request_duration,
+    request_queries,
+    reset_metrics,
+)
+from app.models import Item
+
+# Generous budgets so the benchmark catches regressions, not CI noise
+MIDDLEWARE_OVERHEAD_BUDGET_SECONDS = 100e-6
+QUERY_HOOK_OVERHEAD_BUDGET_SECONDS = 10e-6
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("test_seconds", "Test histogram.", (0.1, 1.0))
+    histogram.observe(0.05, route="a")
+    histogram.observe(0.5, route="a")
+    histogram.observe(5.0, route="a")
+
+    lines = histogram.render()
+
+    assert "# TYPE test_seconds histogram" in lines
+    assert 'test_seconds_bucket{route="a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{route="a",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{route="a",le="+Inf"} 3' in lines
+    assert 'test_seconds_sum{route="a"} 5.55' in lines
+    assert 'test_seconds_count{route="a"} 3' in lines
+
+
+class TestMetricsEndpoint:
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_records_route_latency_and_queries(
+        self, test_client, engine, db_session, authenticated_user
+    ):
+        """Test requests are labelled by operation id with their SQL counts."""
+        install_query_hooks(engine)
+        user_id = authenticated_user["user"].id
+        await db_session.execute(insert(Item).values(name="Item", user_id=user_id))
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/items/", headers=authenticated_user["headers"]
+        )
+        assert response.status_code == 200
+
+        assert (
+            request_duration.count(route="item-read_item", method="GET", status="200")
+            == 1
+        )
+        # User lookup, COUNT and page query
+        assert request_queries.total(route="item-read_item") == 3
+
+        metrics = await test_client.get("/metrics")
+        assert metrics.status_code == 200
+        assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="item-read_item",status="200"} 1'
+        ) in metrics.text
+        assert "db_pool_checkouts_total" in metrics.text
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_unmatched_and_metrics_requests(self, test_client):
+        """Test 404s share one label and scrapes are not recorded."""
+        await test_client.get("/does-not-exist")
+        await test_client.get("/metrics")
+
+        assert (
+            request_duration.count(route="unmatched", method="GET", status="404") == 1
+        )
+        assert (
+            request_duration.count(route="metrics-metrics", method="GET", status="200")
+            == 0
+        )
+
+
+def build_probe_app(instrumented):
+    app = FastAPI()
+
+    @app.get("/probe")
+    async def probe():
+        return {"ok": True}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def time_requests(app, iterations):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/probe",
+        "raw_path": b"/probe",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("test", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(100):
+        await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / iterations
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_middleware_overhead_benchmark():
+    """Benchmark the middleware against the same app without it."""
+    iterations = 2000
+    plain = build_probe_app(instrumented=False)
+    instrumented = build_probe_app(instrumented=True)
+
+    # Best of three rounds to damp scheduler noise
+    baseline = min([await time_requests(plain, iterations) for _ in range(3)])
+    measured = min([await time_requests(instrumented, iterations) for _ in range(3)])
+    overhead = measured - baseline
+
+    print(f"\nmetrics middleware overhead: {overhead * 1e6:.1f}us/request")
+    assert overhead < MIDDLEWARE_OVERHEAD_BUDGET_SECONDS
+
+
+def test_query_hook_overhead_benchmark():
+    """Benchmark the SQL hooks that run around every statement."""
+    iterations = 20000
+    conn = SimpleNamespace(info={})
+    token = _request_stats.set(RequestStats())
+    try:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            _before_cursor_execute(conn, None, "SELECT 1", (), None, False)
+            _after_cursor_execute(conn, None, "SELECT 1", (), None, False)
+        per_query = (time.perf_counter() - start) / iterations
+        assert _request_stats.get().queries == iterations
+    finally:
+        _request_stats.reset(token)
+
+    print(f"\nquery hook overhead: {per_query * 1e6:.2f}us/statement")
+    assert per_query < QUERY_HOOK_OVERHEAD_BUDGET_SECONDS
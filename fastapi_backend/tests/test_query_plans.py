@@ -0,0 +1,110 @@
+"""Query plan regression tests for owner-scoped item lookups."""
+
+import uuid
+
+import pytest
+from sqlalchemy import delete, func, insert, select, text
+
+from app.models import Item, User
+
+USERS = 100
+ITEMS_PER_USER = 100
+
+
+async def explain(db_session, query):
+    """Return the textual plan Postgres chooses for ``query``."""
+    compiled = query.compile(
+        dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    connection = await db_session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN {compiled}")
+    return "\n".join(row[0] for row in result)
+
+
+@pytest.fixture
+async def seeded_items(db_session):
+    """Seed several users with items and refresh planner statistics."""
+    user_ids = [uuid.uuid4() for _ in range(USERS)]
+    await db_session.execute(
+        insert(User),
+        [
+            {
+                "id": user_id,
+                "email": f"{user_id}@example.com",
+                "hashed_password": "not-used",
+                "is_active": True,
+                "is_superuser": False,
+                "is_verified": True,
+            }
+            for user_id in user_ids
+        ],
+    )
+    await db_session.execute(
+        insert(Item),
+        [
+            {"name": f"Item {i}", "user_id": user_id}
+            for user_id in user_ids
+            for i in range(ITEMS_PER_USER)
+        ],
+    )
+    await db_session.commit()
+    await db_session.execute(text("ANALYZE items"))
+    return user_ids
+
+
+@pytest.mark.asyncio
+async def test_item_list_uses_index(db_session, seeded_items):
+    query = (
+        select(Item)
+        .filter(Item.user_id == seeded_items[0])
+        .order_by(Item.id)
+        .limit(10)
+        .offset(20)
+    )
+
+    plan = await explain(db_session, query)
+
+    assert "Seq Scan" not in plan
+    assert "ix_items_user_id_id" in plan
+
+
+@pytest.mark.asyncio
+async def test_item_count_uses_index(db_session, seeded_items):
+    query = select(func.count()).select_from(
+        select(Item).filter(Item.user_id == seeded_items[0]).subquery()
+    )
+
+    plan = await explain(db_session, query)
+
+    assert "Seq Scan" not in plan
+    assert "ix_items_user_id_id" in plan
+
+
+@pytest.mark.asyncio
+async def test_item_cursor_page_uses_index(db_session, seeded_items):
+    query = (
+        select(Item)
+        .filter(Item.user_id == seeded_items[0], Item.id > uuid.UUID(int=0))
+        .order_by(Item.id)
+        .limit(11)
+    )
+
+    plan = await explain(db_session, query)
+
+    assert "Seq Scan" not in plan
+    assert "ix_items_user_id_id" in plan
+
+
+@pytest.mark.asyncio
+async def test_item_delete_uses_index(db_session, seeded_items):
+    item_id = (
+        await db_session.execute(
+            select(Item.id).filter(Item.user_id == seeded_items[0]).limit(1)
+        )
+    ).scalar_one()
+    query = delete(Item).where(Item.id == item_id, Item.user_id == seeded_items[0])
+
+    plan = await explain(db_session, query)
+
+    assert "Seq Scan" not in plan
+    assert "Index Scan" in plan